@@ -1,5 +1,5 @@
 from .async_moduvent import AsyncEventAwareBase, AsyncEventManager
-from .common import subscribe_method
+from .common import Subscription, subscribe_method
 from .events import (
     DataEvent,
     DataEventFactory,
@@ -7,6 +7,8 @@ from .events import (
     EventFactory,
     Signal,
     SignalFactory,
+    SlottedDataEvent,
+    SlottedSignal,
 )
 from .module_loader import ModuleLoader
 from .moduvent import EventAwareBase, EventManager
@@ -17,6 +19,7 @@ register = event_manager.register
 subscribe = event_manager.subscribe
 unsubscribe = event_manager.unsubscribe
 emit = event_manager.emit
+emit_many = event_manager.emit_many
 reset = event_manager.reset
 halt = event_manager.halt
 
@@ -26,6 +29,7 @@ aregister = aevent_manager.register
 asubscribe = aevent_manager.subscribe
 aunsubscribe = aevent_manager.unsubscribe
 aemit = aevent_manager.emit
+aemit_many = aevent_manager.emit_many
 initialize = aevent_manager.initialize
 areset = aevent_manager.reset
 ahalt = aevent_manager.halt
@@ -44,20 +48,26 @@ __all__ = [
     "register",
     "subscribe",
     "subscribe_method",
+    "Subscription",
     "unsubscribe",
     "emit",
+    "emit_many",
     "AsyncEventManager",
     "AsyncEventAwareBase",
     "aevent_manager",
     "aregister",
     "asubscribe",
     "aunsubscribe",
+    "aemit",
+    "aemit_many",
     "module_loader",
     "discover_modules",
     "Signal",
     "signal",
     "DataEvent",
     "data_event",
+    "SlottedSignal",
+    "SlottedDataEvent",
     "initialize",
     "reset",
     "EventFactory",
@@ -1,9 +1,25 @@
 import asyncio
+import heapq
+import inspect
 from abc import abstractmethod
-from collections import defaultdict
-from collections.abc import Callable
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable
+from contextvars import ContextVar
+from itertools import count
 from threading import RLock
-from typing import Any, Awaitable, Dict, Generic, List, Tuple, Type
+from time import monotonic, perf_counter
+from typing import (
+    Any,
+    Awaitable,
+    Deque,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 from loguru import logger
 
@@ -11,22 +27,37 @@ from .common import (
     BaseCallbackProcessing,
     BaseCallbackRegistry,
     BaseEventManager,
+    CoalesceRule,
+    DispatchPlan,
+    PendingEvent,
     PostCallbackRegistry,
+    Subscription,
 )
 from .events import E, EventMeta
-from .utils import SUBSCRIPTION_STRATEGY, get_subscription_strategy
+from .utils import (
+    OVERFLOW_POLICY,
+    SUBSCRIPTION_STRATEGY,
+    get_subscription_strategy,
+    is_coroutine_callable,
+)
 
 async_moduvent_logger = logger.bind(source="moduvent_async")
 
+# set in the tasks of the worker pool, nested emits run their callbacks inline instead of waiting on the pool
+_in_worker: ContextVar[bool] = ContextVar("moduvent_in_worker", default=False)
+
 
 class AsyncPostCallbackRegistry(PostCallbackRegistry[E]):
+    __slots__ = ()
+
     def __init__(
         self,
         func: Callable[[E], Awaitable],
         event_type: Type[E],
         conditions: Tuple[Callable[[E], bool], ...] = (),
+        options: Dict[str, Any] | None = None,
     ) -> None:
-        super().__init__(func, event_type, conditions)
+        super().__init__(func, event_type, conditions, options)
 
     def __eq__(self, value):
         if isinstance(value, AsyncPostCallbackRegistry):
@@ -35,19 +66,108 @@ class AsyncPostCallbackRegistry(PostCallbackRegistry[E]):
 
 
 class AsyncCallbackRegistry(BaseCallbackRegistry[E]):
+    __slots__ = ("coroutine", "blocking")
+
+    def __init__(
+        self,
+        func: Callable[[E], Awaitable],
+        event_type: Type[E],
+        conditions: Tuple[Callable[[E], bool], ...] = (),
+    ) -> None:
+        super().__init__(func, event_type, conditions)
+        # set by the event manager on registration, plain functions are called without a task
+        self.coroutine = True
+        # set by the event manager on registration, run a plain function in a thread instead of the event loop
+        self.blocking = False
+
     def __eq__(self, value):
         if isinstance(value, AsyncCallbackRegistry):
             return self._compare_attributes(value)
         return super().__eq__(value)
 
 
-class AsyncCallbackProcessing(BaseCallbackProcessing[E], AsyncCallbackRegistry):
+class AsyncCallbackProcessing(BaseCallbackProcessing[E]):
+    __slots__ = ()
+    registry_class = AsyncCallbackRegistry
+
+    @property
+    def inline(self) -> bool:
+        """A plain function that is not blocking, the event manager calls it in place with call_inline()."""
+        callback = self.callback
+        return not (callback.coroutine or callback.blocking)
+
     async def call(self):  # pyright: ignore[reportIncompatibleMethodOverride] (async version)
-        if super().is_callable():
+        func = self._resolve_func()
+        if func is not None:
+            callback = self.callback
+            metrics = callback.metrics
+            start = perf_counter() if metrics is not None else 0.0
             try:
-                return await self.func(self.event)
+                if callback.coroutine:
+                    return await func(self.event)
+                if callback.blocking:
+                    return await asyncio.to_thread(func, self.event)
+                result = func(self.event)
+                # a plain function may still hand back an awaitable
+                return await result if inspect.isawaitable(result) else result
             except Exception as e:
+                if metrics is not None:
+                    metrics.errors += 1
                 async_moduvent_logger.exception(f"Error while calling {self}: {e}")
+            finally:
+                if metrics is not None:
+                    metrics.observe(perf_counter() - start)
+
+    def call_inline(self):
+        """Call a plain function in place, an awaitable it returns is scheduled as a task.
+        The latency recorded in the metrics is the one of the call, not of the awaitable."""
+        func = self._resolve_func()
+        if func is not None:
+            metrics = self.callback.metrics
+            start = perf_counter() if metrics is not None else 0.0
+            try:
+                result = func(self.event)
+                if inspect.isawaitable(result):
+                    return asyncio.ensure_future(result)
+                return result
+            except Exception as e:
+                if metrics is not None:
+                    metrics.errors += 1
+                async_moduvent_logger.exception(f"Error while calling {self}: {e}")
+            finally:
+                if metrics is not None:
+                    metrics.observe(perf_counter() - start)
+
+
+# (-priority, sequence, processing, future of its result or None when the emitter does not wait)
+CallqueueItem = Tuple[int, int, "AsyncCallbackProcessing", Optional[asyncio.Future]]
+
+
+class _Callqueue(asyncio.PriorityQueue):
+    """The callqueue of the worker pool: higher priority first, then first in first out."""
+
+    def pop_oldest(self) -> CallqueueItem:
+        """Remove and return the oldest item of the lowest queued priority, the first one to drop."""
+        heap = self._queue  # pyright: ignore[reportAttributeAccessIssue] (the heap of PriorityQueue)
+        lowest = max(heap)[0]
+        index = min(
+            (index for index, item in enumerate(heap) if item[0] == lowest),
+            key=lambda index: heap[index][1],
+        )
+        item = heap[index]
+        heap[index] = heap[-1]
+        heap.pop()
+        heapq.heapify(heap)
+        self.task_done()
+        return item
+
+
+async def _gather_results(futures: List[asyncio.Future]) -> List:
+    """The results of futures in order, without a trip through gather when all of them are done."""
+    for future in futures:
+        if not future.done():
+            return list(await asyncio.gather(*futures))
+    return [future.result() for future in futures]
 
 
 # We say that a subscription is the information that a method wants to be called back
@@ -55,18 +175,61 @@ class AsyncCallbackProcessing(BaseCallbackProcessing[E], AsyncCallbackRegistry):
 class AsyncEventManager(
     BaseEventManager[AsyncCallbackRegistry, AsyncCallbackProcessing, E]
 ):
-    def __init__(self):
+    def __init__(
+        self,
+        hierarchical: bool = False,
+        trace: bool = False,
+        worker_count: int = 10,
+        maxsize: int = 0,
+        overflow: OVERFLOW_POLICY | str = OVERFLOW_POLICY.BLOCK,
+        adaptive_conditions: bool = False,
+        adapt_interval: int = 1000,
+        adapt_sample: int = 100,
+        eager: bool = False,
+        metrics: bool = False,
+    ):
         self._subscriptions: Dict[Type[E], List[AsyncCallbackRegistry]] = defaultdict(
             list
         )
+        self._dispatch_plans: Dict[Type[E], DispatchPlan] = {}
+        self._registration_order = count()
+        self._registrations: Dict[
+            int | Tuple[int, int], List[AsyncCallbackRegistry]
+        ] = {}
+        self._dead_registrations: Deque[AsyncCallbackRegistry] = deque()
+        self.pruned_registrations = 0
+        self._hierarchical = hierarchical
+        self.trace = trace
         self._post_subscriptions: Dict[Type[E], List[PostCallbackRegistry]] = (
             defaultdict(list)
         )
-        self._callqueue: asyncio.Queue[AsyncCallbackProcessing] = asyncio.Queue()
+        self._callqueue: _Callqueue = _Callqueue(maxsize)
+        self._callqueue_sequence = count()
+        # see OVERFLOW_POLICY for what happens to callbacks queued beyond maxsize
+        self.maxsize = maxsize
+        self.overflow = OVERFLOW_POLICY(overflow)
+        self.dropped_events = 0
+        self.blocked_events = 0
+        self._coalescing: Dict[type, CoalesceRule] = {}
+        self._pending_events: Dict[Tuple[type, Any], PendingEvent] = {}
+        self.coalesced_events = 0
+        # run the conditions of each registration in the order that rejects events the cheapest
+        self.adaptive_conditions = adaptive_conditions
+        self.adapt_interval = adapt_interval
+        self.adapt_sample = adapt_sample
         self._subscription_lock = asyncio.Lock()
         self._post_subscription_lock = RLock()
 
-        self.worker_count = 10
+        self.worker_count = worker_count
+        self._workers: List[asyncio.Task] = []
+        self._workers_loop: Optional[asyncio.AbstractEventLoop] = None
+        # start coroutine callbacks in the emitting task, only the ones that suspend continue as tasks
+        self.eager = eager
+        # tasks nobody awaits (eager fire and forget, released coalesced events), the loop only keeps weak references
+        self._background_tasks: Set[asyncio.Task] = set()
+        # count emits, calls, errors and latencies, read them with stats()
+        if metrics:
+            self.enable_metrics()
 
     @property
     def registry_class(cls) -> Type[AsyncCallbackRegistry]:
@@ -82,56 +245,226 @@ class AsyncEventManager(
         async with self._subscription_lock:
             return super()._set_subscriptions(subscriptions)
 
-    async def _append_to_callqueue(self, callback: AsyncCallbackProcessing):  # pyright: ignore[reportIncompatibleMethodOverride] (async version)
-        await self._callqueue.put(callback)
+    async def _append_to_callqueue(  # pyright: ignore[reportIncompatibleMethodOverride] (async version)
+        self,
+        callback: AsyncCallbackProcessing,
+        future: Optional[asyncio.Future] = None,
+    ):
+        queue = self._callqueue
+        item = (-callback.priority, next(self._callqueue_sequence), callback, future)
+        if queue.full():
+            overflow = self.overflow
+            if overflow is OVERFLOW_POLICY.BLOCK:
+                self.blocked_events += 1
+                if _in_worker.get():
+                    # waiting for room in a worker could leave no worker to make it, call it here instead
+                    result = await callback.call()
+                    if future is not None:
+                        future.set_result(result)
+                    return
+                await queue.put(item)
+                if self.metrics is not None:
+                    self.metrics.observe_queue(queue.qsize())
+                return
+            if overflow is OVERFLOW_POLICY.RAISE:
+                raise asyncio.QueueFull(
+                    f"Callqueue is full ({self.maxsize}), cannot queue {callback}"
+                )
+            self.dropped_events += 1
+            if overflow is OVERFLOW_POLICY.DROP_NEWEST:
+                dropped, dropped_future = callback, future
+            else:
+                _, _, dropped, dropped_future = queue.pop_oldest()
+                queue.put_nowait(item)
+            if self.trace:
+                async_moduvent_logger.debug(f"Callqueue is full, dropping {dropped}")
+            if dropped_future is not None and not dropped_future.done():
+                dropped_future.set_result(None)
+            return
+        queue.put_nowait(item)
+        if self.metrics is not None:
+            self.metrics.observe_queue(queue.qsize())
+
+    def _check_callqueue_room(self, count: int):
+        """Under the raise policy, raise asyncio.QueueFull before calling or queuing any callback of an emit
+        whose count queued callbacks do not fit, so that a failed emit leaves nothing behind."""
+        if not self.maxsize or self.overflow is not OVERFLOW_POLICY.RAISE:
+            return
+        if self._callqueue.qsize() + count > self.maxsize:
+            raise asyncio.QueueFull(
+                f"Callqueue is full ({self.maxsize}), cannot queue {count} callbacks"
+            )
 
     def _get_callqueue_length(self) -> int:
         return self._callqueue.qsize()
 
     async def reset(self):  # pyright: ignore[reportIncompatibleMethodOverride] (async version)
         async with self._subscription_lock:
-            self._subscriptions.clear()
+            self._clear_subscriptions()
 
     async def halt(self):  # pyright: ignore[reportIncompatibleMethodOverride] (async version)
         async with self._subscription_lock:
-            self._subscriptions.clear()
+            self._clear_subscriptions()
 
-    async def _process_callqueue(self):  # pyright: ignore[reportIncompatibleMethodOverride] (async version)
-        if self.halted:
+    @property
+    def running(self) -> bool:
+        """Whether the worker pool is running in the current event loop."""
+        return bool(self._workers) and self._workers_loop is asyncio.get_running_loop()
+
+    async def start(self):
+        """Start worker_count worker tasks consuming the callqueue, emit starts them on first use.
+        The pool belongs to the running event loop and is restarted if used from another loop."""
+        if self.running:
             return
-        # note that asyncio.Queue is not iterable
-        async_moduvent_logger.debug(f"Callqueue ({self._get_callqueue_length()}):")
-        # for i in range(self._get_callqueue_length()):
-        #     callback = self._callqueue.get_nowait()
-        #     async_moduvent_logger.debug(f"\t{callable}")
-        #     self._callqueue.put_nowait(callback)
-        async_moduvent_logger.debug("Processing callqueue...")
-        # The asyncio.Queue is naturally corotine-safe
-        tasks = []
-        async with asyncio.TaskGroup() as group:
-            while not self._callqueue.empty():
-                callback = await self._callqueue.get()
-                async_moduvent_logger.debug(f"Calling {callback}...")
-                try:
-                    tasks.append(group.create_task(callback.call()))
-                    self._callqueue.task_done()
-                except Exception as e:
-                    async_moduvent_logger.exception(
-                        f"Error while processing callback: {e}"
-                    )
-                    continue
+        loop = asyncio.get_running_loop()
+        if self._workers_loop is not None and self._workers_loop is not loop:
+            # the previous loop is gone together with its workers, the queue was bound to it
+            self._workers.clear()
+            self._callqueue = _Callqueue(self.maxsize)
+        self._workers_loop = loop
+        self._workers = [
+            loop.create_task(self._worker(), name=f"moduvent-worker-{index}")
+            for index in range(max(1, self.worker_count))
+        ]
+        if self.trace:
+            async_moduvent_logger.debug(f"Started {len(self._workers)} workers.")
+
+    async def stop(self, drain: bool = True):
+        """Stop the worker pool, waiting for the queued callbacks first if drain is set.
+        Otherwise the queued callbacks are dropped and their emitters receive None."""
+        if not self.running:
+            return
+        if drain:
             await self._callqueue.join()
-        async_moduvent_logger.debug("End processing callqueue.")
-        return [task.result() for task in tasks]
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        while not self._callqueue.empty():
+            *_, future = self._callqueue.get_nowait()
+            if future is not None and not future.done():
+                future.set_result(None)
+            self._callqueue.task_done()
+        if self.trace:
+            async_moduvent_logger.debug(f"Stopped {len(workers)} workers.")
+
+    async def _worker(self):
+        _in_worker.set(True)
+        queue = self._callqueue
+        trace = self.trace
+        while True:
+            _, _, processing, future = await queue.get()
+            try:
+                if trace:
+                    async_moduvent_logger.debug(f"Calling {processing}...")
+                result = await processing.call()
+            except asyncio.CancelledError:
+                if future is not None and not future.done():
+                    future.set_result(None)
+                raise
+            except Exception as e:
+                async_moduvent_logger.exception(f"Error while processing callback: {e}")
+                result = None
+            finally:
+                queue.task_done()
+            if future is not None and not future.done():
+                future.set_result(result)
+
+    async def _process_callqueue(self):  # pyright: ignore[reportIncompatibleMethodOverride] (async version)
+        """Wait until the workers have processed every queued callback."""
+        if self.halted:
+            return []
+        await self.start()
+        await self._callqueue.join()
+        return []
+
+    async def _dispatch_processings(  # pyright: ignore[reportIncompatibleMethodOverride] (async version)
+        self, processings: List[AsyncCallbackProcessing], wait: bool
+    ) -> List[asyncio.Future]:
+        """Call the inline processings and queue the others for the workers.
+        An inline processing behind a queued one of higher priority is queued too, so that it does not overtake it.
+        Return the futures of their results in order if wait is set."""
+        loop = asyncio.get_running_loop()
+        # the pool may be busy with the very callbacks waiting on a nested emit, run them in this task
+        nested = wait and _in_worker.get()
+        eager = self.eager
+        trace = self.trace
+        # priority of the first processing left to the workers or to a task, processings come in dispatch order
+        deferred_priority = None
+        run_inline = []
+        for processing in processings:
+            inline = processing.inline and (
+                deferred_priority is None
+                or processing.callback.priority >= deferred_priority
+            )
+            if not inline and not eager and deferred_priority is None:
+                deferred_priority = processing.callback.priority
+            run_inline.append(inline)
+        if not (eager or nested):
+            self._check_callqueue_room(len(run_inline) - sum(run_inline))
+        futures = []
+        for processing, inline in zip(processings, run_inline):
+            if inline:
+                if trace:
+                    async_moduvent_logger.debug(f"Calling {processing} inline...")
+                result = processing.call_inline()
+                if wait:
+                    if not isinstance(result, asyncio.Future):
+                        value, result = result, loop.create_future()
+                        result.set_result(value)
+                    futures.append(result)
+            elif eager:
+                if trace:
+                    async_moduvent_logger.debug(f"Calling {processing} eagerly...")
+                task = asyncio.Task(processing.call(), loop=loop, eager_start=True)
+                if wait:
+                    futures.append(task)
+                elif not task.done():
+                    self._keep_task(task)
+            elif nested:
+                futures.append(loop.create_task(processing.call()))
+            else:
+                if not self.running:
+                    await self.start()
+                if trace:
+                    async_moduvent_logger.debug(f"Adding {processing} to callqueue...")
+                future = loop.create_future() if wait else None
+                await self._append_to_callqueue(processing, future)
+                if wait:
+                    futures.append(future)
+        return futures
 
     async def register(  # pyright: ignore[reportIncompatibleMethodOverride] (async version)
         self,
-        func: Callable[[E], None],
+        func: Callable[[E], Any],
         event_type: Type[E],
         *conditions: Callable[[E], bool],
-    ):
+        blocking: bool = False,
+        priority: int = 0,
+        where: Dict[str, Any] | None = None,
+        rate_limit: float | None = None,
+        burst: int = 1,
+        throttle: float | None = None,
+        trailing: bool = False,
+    ) -> Subscription[AsyncCallbackRegistry]:
+        """Register func, a coroutine function or a plain function.
+        Plain functions are called in place by the emitter, or in a thread if blocking is set."""
         async with self._subscription_lock:
-            super().register(func, event_type, *conditions)
+            subscription = super().register(
+                func,
+                event_type,
+                *conditions,
+                priority=priority,
+                where=where,
+                rate_limit=rate_limit,
+                burst=burst,
+                throttle=throttle,
+                trailing=trailing,
+            )
+            # no await since super().register(), so no emit can see the registration before this
+            subscription.registry.coroutine = is_coroutine_callable(func)
+            subscription.registry.blocking = blocking
+            return subscription
 
     async def initialize(self):
         """Call this in main event loop to register post-subscriptions."""
@@ -143,7 +476,14 @@ class AsyncEventManager(
             async with asyncio.TaskGroup() as group:
                 for event_type, callbacks in self._post_subscriptions.items():
                     for callback in callbacks:
-                        group.create_task(self.register(callback.func, event_type))
+                        group.create_task(
+                            self.register(
+                                callback.func,
+                                event_type,
+                                *callback.conditions,
+                                **callback.options,
+                            )
+                        )
         self._post_subscriptions.clear()
 
     def subscribe(self, *args, **kwargs):
@@ -155,7 +495,9 @@ class AsyncEventManager(
             ):
                 for event_type in args:
                     self._post_subscriptions[event_type].append(
-                        PostCallbackRegistry(func=func, event_type=event_type)
+                        PostCallbackRegistry(
+                            func=func, event_type=event_type, options=kwargs
+                        )
                     )
                 return func
 
@@ -169,7 +511,10 @@ class AsyncEventManager(
             ):
                 self._post_subscriptions[event_type].append(
                     PostCallbackRegistry(
-                        func=func, event_type=event_type, conditions=conditions
+                        func=func,
+                        event_type=event_type,
+                        conditions=conditions,
+                        options=kwargs,
                     )
                 )
                 return func
@@ -178,28 +523,98 @@ class AsyncEventManager(
         else:
             raise ValueError(f"Invalid subscription strategy: {strategy}")
 
-    async def emit(self, event: E):  # pyright: ignore[reportIncompatibleMethodOverride] (async version)
+    async def emit(self, event: E, wait: bool = True):  # pyright: ignore[reportIncompatibleMethodOverride] (async version)
+        """Queue the callbacks of event for the worker pool and return their results in dispatch order.
+        With wait=False the callbacks are queued and [] is returned immediately (fire and forget)."""
         valid, event_type = self._emit_check(event)
         if not valid:
-            return
-        async_moduvent_logger.debug(f"Emitting {event}")
-        if event_type in self._subscriptions:
-            logger.debug(f"Processing {event_type.__qualname__} subscriptions...")
-            callbacks = self._subscriptions[event_type]
+            return []
+        if self.metrics is not None:
+            self.metrics.emits[event_type] += 1
+        if self._coalescing and event_type in self._coalescing:
+            self._hold_event(event, self._coalescing[event_type])
+            return []
+        if self._dead_registrations:
+            self._prune_dead_registrations()
+        trace = self.trace
+        if trace:
+            async_moduvent_logger.debug(f"Emitting {event}")
+        plan = self._get_dispatch_plan(event_type)
+        if not plan:
+            return []
+        if trace:
             async_moduvent_logger.debug(
-                f"Processing {event_type.__qualname__} ({len(callbacks)} callbacks)"
+                f"Processing {event_type.__qualname__} ({len(plan)} callbacks)"
             )
-            for callback in callbacks:
-                logger.debug(f"Adding {callback} to callqueue...")
-                await self._append_to_callqueue(
-                    self.processing_class(
-                        func=callback.func,
-                        event=event,
-                        conditions=callback.conditions,
-                    )
-                )
+        futures = await self._dispatch_processings(
+            self._prepare_processings(event, plan, trace), wait
+        )
+        return await _gather_results(futures)
+
+    async def emit_many(self, events: Iterable[E], wait: bool = True) -> List[List]:  # pyright: ignore[reportIncompatibleMethodOverride] (async version)
+        """Emit a batch of events and return the results of each event in input order.
+        Event types are checked and resolved once per batch and all callbacks are queued before waiting on any."""
+        return await self._emit_batch(events, wait, coalesce=True)
+
+    async def flush(self) -> List[List]:
+        """Release every event held by coalescing now and return the results of each of them."""
+        return await self._emit_batch(self._take_pending_events(), True, coalesce=False)
+
+    def _on_event_held(self, key: Tuple[type, Any], pending: PendingEvent, rule):
+        if rule.window is not None:
+            asyncio.get_running_loop().call_later(
+                rule.window, self._release_pending, key, pending
+            )
+
+    def _release_pending(self, key: Tuple[type, Any], pending: PendingEvent):
+        """Timer callback releasing the event held by key once its deadline is reached."""
+        if self._pending_events.get(key) is not pending:
+            return  # flushed in the meantime
+        delay = pending.deadline - monotonic()
+        if delay > 0:  # debounced by a later event
+            asyncio.get_running_loop().call_later(
+                delay, self._release_pending, key, pending
+            )
+            return
+        del self._pending_events[key]
+        self._keep_task(
+            asyncio.ensure_future(
+                self._emit_batch([pending.event], False, coalesce=False)
+            )
+        )
+
+    def _on_deferred(self, callback: AsyncCallbackRegistry):
+        asyncio.get_running_loop().call_later(
+            callback.limiter.delay(), self._release_trailing, callback
+        )
+
+    def _release_trailing(self, callback: AsyncCallbackRegistry):
+        """Timer callback releasing the event held by the trailing throttle of callback."""
+        processing = self._release_deferred(callback)
+        if processing is None:
+            if callback.limiter.pending is not None:
+                self._on_deferred(callback)
+            return
+        self._keep_task(
+            asyncio.ensure_future(self._dispatch_processings([processing], False))
+        )
+
+    def _keep_task(self, task: asyncio.Task):
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
 
-        await self._process_callqueue()
+    async def _emit_batch(
+        self, events: Iterable[E], wait: bool, coalesce: bool
+    ) -> List[List]:
+        # each event is dispatched before the next one is prepared, as with emit
+        futures = [
+            await self._dispatch_processings(processings, wait)
+            for processings in self._prepare_batch(events, coalesce)
+        ]
+        if not wait:
+            return [[] for _ in futures]
+        results = iter(await _gather_results([f for fs in futures for f in fs]))
+        return [[next(results) for _ in event_futures] for event_futures in futures]
 
 
 class AsyncEventAwareBase(Generic[E], metaclass=EventMeta):
@@ -227,4 +642,5 @@ class AsyncEventAwareBase(Generic[E], metaclass=EventMeta):
                     getattr(self, callback.func.__name__),
                     event_type,
                     *callback.conditions,
+                    **callback.options,
                 )
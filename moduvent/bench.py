@@ -0,0 +1,541 @@
+"""Micro-benchmarks of the moduvent hot paths.
+
+Run all of them with ``python -m moduvent.bench`` or pick some by name, e.g. ``python -m moduvent.bench tracing``.
+Only the standard library is used so that the numbers can be collected anywhere moduvent runs.
+``--json results.json`` writes the results, ``--baseline results.json`` compares a run with results written before
+and exits with status 1 if a metric regressed by more than ``--tolerance``.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import tempfile
+import threading
+import time
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from itertools import count
+from pathlib import Path
+from typing import Any, Dict, List
+
+from loguru import logger
+
+from . import event_manager as global_event_manager
+from .async_moduvent import AsyncEventManager
+from .common import subscribe_method
+from .events import (
+    DataEvent,
+    Event,
+    SlottedDataEvent,
+    SlottedDataEventFactory,
+)
+from .module_loader import ModuleLoader
+from .moduvent import EventAwareBase, EventManager
+
+
+class BenchEvent(Event):
+    def __init__(self, value: int = 0):
+        self.value = value
+
+
+def _handler(event: BenchEvent):
+    return event.value
+
+
+class _DictDataEvent(Event):
+    """DataEvent laid out with only an instance __dict__, as it was before it declared __slots__."""
+
+    def __init__(self, data, sender: object = None):
+        self.data = data
+        self.sender = sender
+
+
+def measure_allocation(factory: Callable[[], Any], count: int = 100_000) -> float:
+    """Return the bytes traced by tracemalloc per object created by factory."""
+    objects = [None] * count
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for index in range(count):
+            objects[index] = factory()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / count
+
+
+def measure_peak(func: Callable[[], Any], number: int = 1000) -> float:
+    """Return the mean peak of memory traced by tracemalloc during a call of func, in bytes.
+    The peak above the memory held before the call counts what the call allocates, even if it is freed before returning."""
+    func()  # warm up caches
+    tracemalloc.start()
+    try:
+        total = 0
+        for _ in range(number):
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            func()
+            total += tracemalloc.get_traced_memory()[1] - current
+    finally:
+        tracemalloc.stop()
+    return total / number
+
+
+async def _async_handler(event: BenchEvent):
+    return event.value
+
+
+def measure(func: Callable[[], Any], number: int = 1000, repeat: int = 5) -> float:
+    """Return the best time of a single call of func in microseconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def bench_tracing(handlers: int = 10) -> Dict[str, float]:
+    """emit latency with the tracing switch off and on (loguru without sinks)."""
+    results = {}
+    for trace in (False, True):
+        manager = EventManager(trace=trace)
+        for _ in range(handlers):
+            manager.register(_handler, BenchEvent)
+        event = BenchEvent(1)
+        results[f"emit_us[trace={trace}]"] = measure(
+            lambda manager=manager, event=event: manager.emit(event)
+        )
+    results["speedup"] = (
+        results["emit_us[trace=True]"] / results["emit_us[trace=False]"]
+    )
+    return results
+
+
+def bench_concurrent_emit(
+    thread_counts=(1, 2, 4, 8), emits: int = 20000, handlers: int = 10
+) -> Dict[str, float]:
+    """emit throughput of one manager shared by a growing number of emitting threads."""
+    results = {}
+    for thread_count in thread_counts:
+        manager = EventManager()
+        for _ in range(handlers):
+            manager.register(_handler, BenchEvent)
+        event = BenchEvent(1)
+        per_thread = emits // thread_count
+        barrier = threading.Barrier(thread_count + 1)
+
+        def producer(
+            manager=manager, event=event, barrier=barrier, per_thread=per_thread
+        ):
+            barrier.wait()
+            for _ in range(per_thread):
+                manager.emit(event)
+
+        threads = [threading.Thread(target=producer) for _ in range(thread_count)]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        results[f"emits_per_s[threads={thread_count}]"] = (
+            per_thread * thread_count / elapsed
+        )
+    return results
+
+
+def bench_async_eager(handlers: int = 10, emits: int = 5000) -> Dict[str, float]:
+    """aemit latency of coroutine handlers that never suspend, with eager mode off and on."""
+
+    async def run(eager: bool) -> float:
+        manager = AsyncEventManager(eager=eager)
+        for _ in range(handlers):
+            await manager.register(_async_handler, BenchEvent)
+        event = BenchEvent(1)
+        await manager.emit(event)  # start the worker pool outside of the measurement
+        best = float("inf")
+        for _ in range(5):
+            start = time.perf_counter()
+            for _ in range(emits):
+                await manager.emit(event)
+            best = min(best, (time.perf_counter() - start) / emits * 1e6)
+        await manager.stop()
+        return best
+
+    results = {}
+    for eager in (False, True):
+        results[f"aemit_us[eager={eager}]"] = asyncio.run(run(eager))
+    results["speedup"] = (
+        results["aemit_us[eager=False]"] / results["aemit_us[eager=True]"]
+    )
+    return results
+
+
+def measure_blocks(manager: EventManager, event: Event) -> int:
+    """Return the number of memory blocks allocated by an emit of event that are still alive when its last callback
+    runs, from tracemalloc snapshots. The snapshot taken before the emit is counted too, subtract an empty emit."""
+    snapshots = []
+
+    def probe(event):
+        snapshots.append(tracemalloc.take_snapshot())
+
+    manager.register(probe, type(event), priority=-1)
+    manager.emit(event)  # warm up caches
+    snapshots.clear()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        manager.emit(event)
+    finally:
+        tracemalloc.stop()
+        manager.unsubscribe(probe)
+    return sum(stat.count_diff for stat in snapshots[0].compare_to(before, "filename"))
+
+
+def bench_dispatch_allocations(handlers: int = 10) -> Dict[str, float]:
+    """Memory allocated by an emit to dispatch an event to handlers callbacks, in total and per callback:
+    the peak of bytes, and the count of blocks the dispatch holds when its last callback runs."""
+    manager = EventManager()
+    empty = measure_blocks(manager, BenchEvent(1))
+    for _ in range(handlers):
+        manager.register(_handler, BenchEvent)
+    event = BenchEvent(1)
+    peak = measure_peak(lambda: manager.emit(event))
+    blocks = measure_blocks(manager, event) - empty
+    return {
+        "alloc_bytes_per_emit": peak,
+        "alloc_bytes_per_callback": peak / handlers,
+        "alloc_blocks_per_emit": blocks,
+        "alloc_blocks_per_callback": blocks / handlers,
+    }
+
+
+def bench_event_memory(count: int = 100_000) -> Dict[str, float]:
+    """Bytes per event of a DataEvent with a plain __dict__, DataEvent, SlottedDataEvent and a slotted factory class."""
+    SlottedUpdate = SlottedDataEventFactory.new("bench-slotted-update")
+    return {
+        "bytes_per_event[dict]": measure_allocation(lambda: _DictDataEvent(0), count),
+        "bytes_per_event[DataEvent]": measure_allocation(lambda: DataEvent(0), count),
+        "bytes_per_event[SlottedDataEvent]": measure_allocation(
+            lambda: SlottedDataEvent(0), count
+        ),
+        "bytes_per_event[factory slotted]": measure_allocation(
+            lambda: SlottedUpdate(0), count
+        ),
+    }
+
+
+def bench_registry_memory(count: int = 100_000) -> Dict[str, float]:
+    """Memory held by count registrations made through register(), with the indexes of the manager,
+    and the time to read the attributes of a registry the dispatch path uses."""
+    manager = EventManager()
+    per_registration = measure_allocation(
+        lambda: manager.register(_handler, BenchEvent).registry, count
+    )
+    registry = manager.register(_handler, BenchEvent).registry
+    read = "registry.func; registry.priority; registry.parallel; registry.limiter"
+    best = min(timeit.repeat(read, globals={"registry": registry}, number=100_000))
+    return {
+        "bytes_per_registration": per_registration,
+        f"mb[registrations={count}]": per_registration * count / 1e6,
+        "attribute_reads_ns": best / 100_000 * 1e9,
+    }
+
+
+def bench_metrics(handlers: int = 10) -> Dict[str, float]:
+    """emit latency with the metrics disabled and enabled."""
+    results = {}
+    for metrics in (False, True):
+        manager = EventManager(metrics=metrics)
+        for _ in range(handlers):
+            manager.register(_handler, BenchEvent)
+        event = BenchEvent(1)
+        results[f"emit_us[metrics={metrics}]"] = measure(
+            lambda manager=manager, event=event: manager.emit(event)
+        )
+    results["overhead"] = (
+        results["emit_us[metrics=True]"] / results["emit_us[metrics=False]"]
+    )
+    return results
+
+
+def bench_emit_latency(handler_counts=(1, 10, 100, 1000)) -> Dict[str, float]:
+    """emit latency as the number of handlers of the event type grows."""
+    results = {}
+    for handlers in handler_counts:
+        manager = EventManager()
+        for _ in range(handlers):
+            manager.register(_handler, BenchEvent)
+        event = BenchEvent(1)
+        number = max(10, 10_000 // handlers)
+        results[f"emit_us[handlers={handlers}]"] = measure(
+            lambda manager=manager, event=event: manager.emit(event), number=number
+        )
+    return results
+
+
+def bench_conditions(
+    handlers: int = 100, conditions: int = 4, passing: float = 0.5, warmup: int = 2000
+) -> Dict[str, float]:
+    """emit latency of handlers with several conditions, the last of which rejects part of the events,
+    in declared order, with adaptive condition ordering and with adaptive ordering timing every check.
+    The cheap case shares its passing conditions between the handlers, the expensive case gives every handler
+    its own slow ones. Each manager first emits warmup events, more than its adapt_interval, so that adaptive
+    ordering is measured once it has reordered the conditions."""
+    shared = [lambda event: event.value >= 0 for _ in range(conditions - 1)]
+    threshold = int(passing * 100)
+    results = {}
+    for case in ("cheap", "expensive"):
+        for adaptive, label, sample in (
+            (False, "False", 0),
+            (True, "True", 100),
+            (True, "timed", 1000),
+        ):
+            manager = EventManager(
+                adaptive_conditions=adaptive, adapt_interval=1000, adapt_sample=sample
+            )
+            for _ in range(handlers):
+                if case == "cheap":
+                    always = shared
+                else:
+                    always = [
+                        lambda event: sum(range(200)) >= event.value
+                        for _ in range(conditions - 1)
+                    ]
+                manager.register(
+                    _handler, BenchEvent, *always, lambda event: event.value < threshold
+                )
+            events = [BenchEvent(value % 100) for value in range(100)]
+            values = iter(range(1 << 62))
+
+            def emit(manager=manager, events=events, values=values):
+                manager.emit(events[next(values) % 100])
+
+            for _ in range(warmup):
+                emit()
+            prefix = "" if case == "cheap" else "expensive,"
+            results[f"emit_us[{prefix}adaptive={label}]"] = measure(emit, number=200)
+    return results
+
+
+def bench_registration_churn(registrations: int = 10_000) -> Dict[str, float]:
+    """Cost of registering callbacks among registrations others and removing them again."""
+    manager = EventManager()
+    handlers = [lambda event: None for _ in range(registrations)]
+    for handler in handlers:
+        manager.register(handler, BenchEvent)
+
+    def churn_cancel():
+        manager.register(_handler, BenchEvent).cancel()
+
+    def churn_unsubscribe():
+        manager.register(_handler, BenchEvent)
+        manager.unsubscribe(_handler, BenchEvent)
+
+    return {
+        "register_cancel_us": measure(churn_cancel, number=200),
+        "register_unsubscribe_us": measure(churn_unsubscribe, number=200),
+    }
+
+
+def bench_aware_instantiation(instances: int = 10_000) -> Dict[str, float]:
+    """Cost of instantiating an EventAwareBase subclass with three subscribed methods, instances times,
+    and of an emit reaching two methods of every instance."""
+
+    # defined here so that subscribe_method() does not log on import
+    class Aware(EventAwareBase):
+        @subscribe_method(BenchEvent)
+        def on_first(self, event: BenchEvent): ...
+
+        @subscribe_method(BenchEvent, lambda event: event.value > 0)
+        def on_second(self, event: BenchEvent): ...
+
+        @subscribe_method(DataEvent)
+        def on_data(self, event: DataEvent): ...
+
+    manager = EventManager()
+    keep: List[Aware] = []
+    start = time.perf_counter()
+    for _ in range(instances):
+        keep.append(Aware(manager))
+    elapsed = time.perf_counter() - start
+    event = BenchEvent(1)
+    emit_us = measure(lambda: manager.emit(event), number=2, repeat=3)
+    return {
+        "instantiate_us": elapsed / instances * 1e6,
+        f"emit_us[instances={instances}]": emit_us,
+    }
+
+
+def bench_aemit_fanout(
+    handler_counts=(1, 10, 100), emits: int = 500
+) -> Dict[str, float]:
+    """aemit latency of coroutine handlers as their number grows, waiting for all of them."""
+
+    async def run(handlers: int) -> float:
+        manager = AsyncEventManager()
+        for _ in range(handlers):
+            await manager.register(_async_handler, BenchEvent)
+        event = BenchEvent(1)
+        await manager.emit(event)  # start the worker pool outside of the measurement
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            for _ in range(emits):
+                await manager.emit(event)
+            best = min(best, (time.perf_counter() - start) / emits * 1e6)
+        await manager.stop()
+        return best
+
+    return {
+        f"aemit_us[handlers={handlers}]": asyncio.run(run(handlers))
+        for handlers in handler_counts
+    }
+
+
+_PLUGIN_SOURCE = """from moduvent import Event, subscribe
+
+
+class {name}Event(Event): ...
+
+
+@subscribe({name}Event)
+def on_{name}(event):
+    return event
+"""
+_plugin_runs = count()
+
+
+def _write_plugin_tree(root: Path, prefix: str, plugins: int) -> None:
+    """Write plugins packages of one module each, and as many single-file plugins, under root."""
+    for index in range(plugins):
+        package = root / f"{prefix}_package_{index}"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "handlers.py").write_text(
+            _PLUGIN_SOURCE.format(name=f"{prefix}_package_{index}")
+        )
+        (root / f"{prefix}_file_{index}.py").write_text(
+            _PLUGIN_SOURCE.format(name=f"{prefix}_file_{index}")
+        )
+
+
+def bench_discover_modules(plugins: int = 100, repeat: int = 3) -> Dict[str, float]:
+    """discover_modules startup on a synthetic tree of plugin packages and files subscribing to the global manager.
+    Every run imports a fresh tree, the modules and their registrations are dropped afterwards."""
+    best = float("inf")
+    for _ in range(repeat):
+        prefix = f"bench_plugin_{next(_plugin_runs)}"
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            _write_plugin_tree(root, prefix, plugins)
+            loader = ModuleLoader()
+            start = time.perf_counter()
+            loader.discover_modules(directory)
+            best = min(best, time.perf_counter() - start)
+            sys.path.remove(str(root.resolve()))
+        for name in [name for name in sys.modules if name.startswith(prefix)]:
+            module = sys.modules.pop(name)
+            event_type = getattr(module, f"{name.split('.')[0]}Event", None)
+            if event_type is not None:
+                global_event_manager.unsubscribe(event_type=event_type)
+    return {
+        f"discover_ms[plugins={plugins * 2}]": best * 1e3,
+        "per_plugin_us": best / (plugins * 2) * 1e6,
+    }
+
+
+BENCHMARKS: Dict[str, Callable[[], Dict[str, float]]] = {
+    "tracing": bench_tracing,
+    "concurrent_emit": bench_concurrent_emit,
+    "async_eager": bench_async_eager,
+    "event_memory": bench_event_memory,
+    "dispatch_allocations": bench_dispatch_allocations,
+    "registry_memory": bench_registry_memory,
+    "emit_latency": bench_emit_latency,
+    "conditions": bench_conditions,
+    "registration_churn": bench_registration_churn,
+    "aware_instantiation": bench_aware_instantiation,
+    "aemit_fanout": bench_aemit_fanout,
+    "discover_modules": bench_discover_modules,
+    "metrics": bench_metrics,
+}
+
+# metrics where a higher value is better, every other metric is a time or a size
+_HIGHER_IS_BETTER = ("emits_per_s", "speedup")
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float = 0.1,
+) -> List[str]:
+    """Return a line per metric present in both results and baseline, flagging the ones worse by more than tolerance."""
+    lines = []
+    for name, metrics in results.items():
+        for key, value in metrics.items():
+            before = baseline.get(name, {}).get(key)
+            if not before:
+                continue
+            change = value / before - 1
+            worse = -change if key.startswith(_HIGHER_IS_BETTER) else change
+            flag = "  REGRESSION" if worse > tolerance else ""
+            lines.append(
+                f"{name}.{key}: {before:.3f} -> {value:.3f} ({change:+.1%}){flag}"
+            )
+    return lines
+
+
+def _metadata() -> Dict[str, str]:
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m moduvent.bench")
+    parser.add_argument("names", nargs="*", help=f"any of {', '.join(BENCHMARKS)}")
+    parser.add_argument("--json", type=Path, help="write the results to this file")
+    parser.add_argument(
+        "--baseline", type=Path, help="compare with the results written to this file"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="relative change of a metric reported as a regression (default: 0.1)",
+    )
+    args = parser.parse_args(argv)
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    # measure the cost of moduvent itself rather than the cost of the sinks
+    logger.remove()
+    results = {}
+    for name in args.names or BENCHMARKS:
+        print(f"{name}:")
+        results[name] = BENCHMARKS[name]()
+        for key, value in results[name].items():
+            print(f"    {key}: {value:.3f}")
+
+    if args.json:
+        args.json.write_text(
+            json.dumps({"metadata": _metadata(), "results": results}, indent=2)
+        )
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        lines = compare(results, baseline, args.tolerance)
+        print(f"compared with {args.baseline}:")
+        for line in lines:
+            print(f"    {line}")
+        if any(line.endswith("REGRESSION") for line in lines):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,34 @@
+import heapq
+import weakref
 from abc import ABC, abstractmethod
-from collections import defaultdict
-from collections.abc import Awaitable, Callable
-from typing import Any, Dict, Generic, List, NoReturn, Tuple, Type, TypeVar
+from bisect import bisect_left, insort
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from operator import attrgetter
+from time import monotonic, perf_counter
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Generic,
+    List,
+    NoReturn,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from loguru import logger
 
-from .descriptors import EventInheritor, EventInstance, WeakReference
 from .events import E, Event
+from .limits import Throttle, TokenBucket
+from .metrics import HandlerMetrics, ManagerMetrics
 from .utils import (
+    OVERFLOW_POLICY,
     SUBSCRIPTION_STRATEGY,
     FunctionTypes,
     check_function_type,
+    get_function_key,
     get_subscription_strategy,
     is_class_and_subclass,
     is_instance_and_subclass,
@@ -19,9 +37,165 @@ from .utils import (
 common_logger = logger.bind(source="moduvent_common")
 
 
+def _remove_identical(items: List, item) -> None:
+    """Remove item from items by identity, avoiding the __eq__ of the registries."""
+    for index, candidate in enumerate(items):
+        if candidate is item:
+            del items[index]
+            return
+
+
+# a condition of a dispatch plan entry paired with whether it is shared with other callbacks of the plan
+ConditionPair = Tuple[Callable[[Any], bool], bool]
+
+
+class ConditionStats:
+    """What adaptive condition ordering observed of one condition of a registration."""
+
+    __slots__ = ("condition", "index", "evaluations", "rejections", "total_time")
+
+    def __init__(self, condition: Callable[[Any], bool], index: int) -> None:
+        self.condition = condition
+        # position of condition among the conditions of the registration
+        self.index = index
+        self.evaluations = 0
+        self.rejections = 0
+        self.total_time = 0.0
+
+    @property
+    def rejection_rate(self) -> float:
+        return self.rejections / self.evaluations if self.evaluations else 0.0
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.evaluations if self.evaluations else 0.0
+
+    def cost(self) -> float:
+        """Expected time spent per rejection, the conditions with the lowest cost should run first.
+        Conditions not evaluated yet come first so that they get measured."""
+        if not self.evaluations:
+            return 0.0
+        if not self.rejections:
+            return float("inf")
+        return self.mean_time / self.rejection_rate
+
+    def __repr__(self) -> str:
+        name = getattr(self.condition, "__qualname__", repr(self.condition))
+        return (
+            f"ConditionStats({name}, evaluations={self.evaluations}, "
+            f"rejection_rate={self.rejection_rate:.3f}, mean_time={self.mean_time:.3g}s)"
+        )
+
+
+class ConditionChain:
+    """The conditions of a registration in the order adaptive condition ordering runs them.
+    Counters are updated without locking, under concurrent emits they are approximate."""
+
+    __slots__ = ("stats", "checks", "source", "ordered")
+
+    def __init__(self, conditions: Tuple[Callable[[Any], bool], ...]) -> None:
+        self.stats: Tuple[ConditionStats, ...] = tuple(
+            ConditionStats(condition, index)
+            for index, condition in enumerate(conditions)
+        )
+        self.checks = 0
+        # the (condition, is_shared) pairs of the dispatch plan ordered was built from, None once reordered
+        self.source: Tuple[ConditionPair, ...] | None = None
+        self.ordered: Tuple[
+            Tuple[Callable[[Any], bool], bool, ConditionStats], ...
+        ] = ()
+
+    def order(
+        self, conditions: Tuple[ConditionPair, ...]
+    ) -> Tuple[Tuple[Callable[[Any], bool], bool, ConditionStats], ...]:
+        """Arrange the (condition, is_shared) pairs of a dispatch plan in the current order, next to their stats."""
+        self.source = conditions
+        self.ordered = tuple((*conditions[stats.index], stats) for stats in self.stats)
+        return self.ordered
+
+    def reorder(self):
+        """Sort the conditions by cost, keeping the current order between equal costs."""
+        self.stats = tuple(sorted(self.stats, key=ConditionStats.cost))
+        self.checks = 0
+        self.source = None
+
+
+# the function types that can be called with an event
+_CALLABLE_TYPES = frozenset(
+    (
+        FunctionTypes.BOUND_METHOD,
+        FunctionTypes.FUNCTION,
+        FunctionTypes.STATICMETHOD,
+        FunctionTypes.BUILTIN,
+        FunctionTypes.PARTIAL,
+        FunctionTypes.CALLABLE_OBJECT,
+    )
+)
+# the function types a registration can be looked up with, including functions of a class body
+_COMPARABLE_TYPES = _CALLABLE_TYPES | {FunctionTypes.UNBOUND_METHOD}
+# the function types held strongly: builtin methods are created on every attribute access and have no __func__
+# for a WeakMethod, partials and callable objects are usually only referenced by their registration
+_STRONG_TYPES = frozenset(
+    (FunctionTypes.BUILTIN, FunctionTypes.PARTIAL, FunctionTypes.CALLABLE_OBJECT)
+)
+
+
+class _StrongReference:
+    """Stands for a weak reference to a callable that is held strongly, keeping it alive."""
+
+    __slots__ = ("func",)
+
+    def __init__(self, func: Callable) -> None:
+        self.func = func
+
+    def __call__(self) -> Callable:
+        return self.func
+
+
+def _weak_reference(
+    func: Callable, func_type: FunctionTypes, on_dead=None
+) -> weakref.ref | _StrongReference:
+    """Weakly reference func, through a WeakMethod for bound methods that are created on every attribute access.
+    Builtins, partials and callable objects are referenced strongly: they are usually created for the registration
+    and nothing else keeps them alive. So are the callables that do not support weak references."""
+    if func is None:
+        raise ValueError("Cannot set weak reference of None")
+    if func_type == FunctionTypes.BOUND_METHOD:
+        return weakref.WeakMethod(func, on_dead)
+    if func_type in _STRONG_TYPES:
+        return _StrongReference(func)
+    try:
+        return weakref.ref(func, on_dead)
+    except TypeError:
+        if func_type == FunctionTypes.UNKNOWN:
+            raise TypeError(f"Cannot set weak reference of {func}") from None
+        return _StrongReference(func)
+
+
+def _func_name(func) -> str:
+    """The qualified name of func, the repr of callables without one."""
+    return getattr(func, "__qualname__", None) or repr(func)
+
+
 class BaseCallbackRegistry(ABC, Generic[E]):
-    func: WeakReference = WeakReference()
-    event_type: EventInheritor = EventInheritor()
+    """A registration of func for event_type, validated once when it is created.
+    It is a slotted record read with plain attribute access on the dispatch path, func is held by a weak reference."""
+
+    __slots__ = (
+        "_func_ref",
+        "func_type",
+        "event_type",
+        "conditions",
+        "order",
+        "priority",
+        "where",
+        "limiter",
+        "condition_chain",
+        "func_key",
+        "parallel",
+        "process",
+        "metrics",
+    )
 
     def __init__(
         self,
@@ -29,25 +203,50 @@ class BaseCallbackRegistry(ABC, Generic[E]):
         event_type: Type[E],
         conditions: Tuple[Callable[[E], bool], ...] = (),
     ) -> None:
-        self.func_type = (
-            FunctionTypes.UNKNOWN
-        )  # we first set func_type since the setter of self.func may use it
-        self.func: WeakReference = func
-        self.event_type: EventInheritor = event_type
+        self.func_type = check_function_type(func)
+        self._func_ref = _weak_reference(func, self.func_type)
+        if not is_class_and_subclass(event_type):
+            raise TypeError(
+                f"{event_type} with {type(event_type)} type is not an inheritor of base event class"
+            )
+        self.event_type = event_type
         self.conditions = conditions or ()
+        # set by the event manager on registration, used to keep registration order across event types
+        self.order = 0
+        # set by the event manager on registration, callbacks of higher priority are called first
+        self.priority = 0
+        # set by the event manager on registration, (attribute name, value) pairs the event must match
+        self.where: Tuple[Tuple[str, Any], ...] | None = None
+        # set by the event manager on registration, skips or defers the events beyond a rate
+        self.limiter: TokenBucket | Throttle | None = None
+        # created by the event manager on the first emit in adaptive condition mode
+        self.condition_chain: ConditionChain | None = None
+        # set by the event manager on registration, the key of func in the reverse index of the manager
+        self.func_key: int | Tuple[int, int] | None = None
+        # set by the event manager on registration, run the callback in the thread pool of the manager
+        self.parallel = False
+        # set by the event manager on registration, run the callback in the process pool of the manager
+        self.process = False
+        # set by the event manager while its metrics are enabled
+        self.metrics: HandlerMetrics | None = None
 
-        self.func_type = check_function_type(func)
+    @property
+    def func(self) -> Callable[[E], Any | Awaitable] | None:
+        """The registered function, None once it has been collected."""
+        return self._func_ref()
+
+    def _watch(self, on_dead: Callable[[weakref.ref], Any]):
+        """Recreate the weak reference to func so that on_dead is called once func is collected.
+        Strongly referenced callables are never collected and never call on_dead."""
+        func = self._func_ref()
+        if func is not None:
+            self._func_ref = _weak_reference(func, self.func_type, on_dead)
 
     def _report_function(self) -> NoReturn:
-        qualname = getattr(self.func, "__qualname__", self.func)
-        raise TypeError(f"Unknown function type for {qualname}")
+        raise TypeError(f"Unknown function type for {_func_name(self.func)}")
 
     def _func_type_valid(self) -> bool:
-        return self.func_type in [
-            FunctionTypes.BOUND_METHOD,
-            FunctionTypes.FUNCTION,
-            FunctionTypes.STATICMETHOD,
-        ]
+        return self.func_type in _CALLABLE_TYPES
 
     def _shallow_copy(
         self, subclass: Type["BaseCallbackRegistry"]
@@ -78,40 +277,30 @@ class BaseCallbackRegistry(ABC, Generic[E]):
     def __eq__(self, value):
         return (
             self.func == value
-            if check_function_type(value)
-            in [
-                FunctionTypes.BOUND_METHOD,
-                FunctionTypes.UNBOUND_METHOD,
-                FunctionTypes.FUNCTION,
-                FunctionTypes.STATICMETHOD,
-            ]
+            if check_function_type(value) in _COMPARABLE_TYPES
             else False
         )
 
     def __str__(self):
-        instance_string = str(getattr(self.func, "__self__", "None"))
-        func_string = self.func.__qualname__ if self.func else self.func
+        func = self.func
+        instance_string = str(getattr(func, "__self__", "None"))
+        func_string = _func_name(func) if func is not None else func
         return f"Callback: {self.event_type} -> {func_string} ({instance_string}:{self.func_type})"
 
 
 class PostCallbackRegistry(BaseCallbackRegistry[E], Generic[E]):
-    func: WeakReference = WeakReference()
-    event_type: EventInheritor = EventInheritor()
+    __slots__ = ("options",)
 
     def __init__(
         self,
         func: Callable[[E], Any | Awaitable] | Callable[[Any, E], Any | Awaitable],
         event_type: Type[E],
         conditions: Tuple[Callable[[E], bool], ...] = (),
+        options: Dict[str, Any] | None = None,
     ) -> None:
-        self.func_type = (
-            FunctionTypes.UNKNOWN
-        )  # we first set func_type since the setter of self.func may use it
-        self.func: WeakReference = func
-        self.event_type: EventInheritor = event_type
-        self.conditions = conditions or ()
-
-        self.func_type = check_function_type(func)
+        super().__init__(func, event_type, conditions)
+        # keyword options of register(), passed on when the subscription is registered
+        self.options = options or {}
 
     def __eq__(self, value):
         if isinstance(value, PostCallbackRegistry):
@@ -119,9 +308,18 @@ class PostCallbackRegistry(BaseCallbackRegistry[E], Generic[E]):
         return super().__eq__(value)
 
 
-class BaseCallbackProcessing(BaseCallbackRegistry, ABC, Generic[E]):
-    func: WeakReference = WeakReference()
-    event: EventInstance = EventInstance()
+def _dispatch_order(callback: BaseCallbackRegistry) -> Tuple[int, int]:
+    """Sort key of the callbacks of an event type: higher priority first, then registration order."""
+    return -callback.priority, callback.order
+
+
+class BaseCallbackProcessing(ABC, Generic[E]):
+    """A registry paired with an event to call it with, the entries of the callqueues.
+    It is a slotted record so that a dispatch allocates one small object per callback,
+    everything else is read from the registry validated at registration."""
+
+    __slots__ = ("callback", "event", "conditions")
+    registry_class: Type[BaseCallbackRegistry]
 
     def __init__(
         self,
@@ -129,35 +327,232 @@ class BaseCallbackProcessing(BaseCallbackRegistry, ABC, Generic[E]):
         event: E,
         conditions: Tuple[Callable[[Event], bool], ...] | None = None,
     ):
-        self.func_type = (
-            FunctionTypes.UNKNOWN
-        )  # we first set func_type since the setter of self.func may use it
-        self.func: WeakReference = func
-        self.event: EventInstance = event
-        self.conditions = conditions or []
+        """Pair func with event outside of an event manager, conditions are checked when it is called."""
+        if not is_instance_and_subclass(event):
+            raise TypeError(
+                f"{event} with {type(event)} type is not an instance of an inheritor of base event class"
+            )
+        callback = self.callback = self.registry_class(func, type(event))
+        if not callback._func_type_valid():
+            callback._report_function()
+        self.event = event
+        self.conditions = tuple(conditions or ())
 
-        self.func_type = check_function_type(func)
+    @classmethod
+    def _resolved(cls, callback: BaseCallbackRegistry, event: E):
+        """Build a processing from a dispatch plan entry.
+        The callback was validated at registration and its conditions were checked by the emitter."""
+        processing = cls.__new__(cls)
+        processing.callback = callback
+        processing.event = event
+        processing.conditions = ()
+        return processing
+
+    @property
+    def func(self):
+        return self.callback._func_ref()
+
+    @property
+    def func_type(self) -> FunctionTypes:
+        return self.callback.func_type
 
-    def is_callable(self) -> bool | NoReturn:
-        """Check if conditions are met. Otherwise raise an error."""
-        if not self._func_type_valid():
-            self._report_function()
-        return bool(self._check_conditions(self.event))
+    @property
+    def parallel(self) -> bool:
+        return self.callback.parallel
+
+    @property
+    def process(self) -> bool:
+        return self.callback.process
+
+    @property
+    def priority(self) -> int:
+        return self.callback.priority
+
+    def _resolve_func(self) -> Callable[[E], Any] | None:
+        """The function to call, None if it was collected or the conditions reject the event."""
+        for condition in self.conditions:
+            if not condition(self.event):
+                common_logger.debug(f"Condition {condition} failed, skipping.")
+                return None
+        return self.callback._func_ref()
 
     @abstractmethod
     def call(self): ...
 
+    def __str__(self):
+        return f"{self.callback} <- {self.event}"
+
 
 BCR = TypeVar("BCR", bound=BaseCallbackRegistry)
 BCP = TypeVar("BCP", bound=BaseCallbackProcessing)
 
 
+class Subscription(Generic[BCR]):
+    """A handle of a registration returned by register(), cancel() it to unsubscribe."""
+
+    __slots__ = ("manager", "registry")
+
+    def __init__(self, manager: "BaseEventManager", registry: BCR) -> None:
+        self.manager = manager
+        self.registry = registry
+
+    @property
+    def active(self) -> bool:
+        return self.registry.func_key is not None
+
+    def cancel(self) -> bool:
+        """Remove the registration, return False if it was already removed."""
+        return self.manager._remove_registration(self.registry)
+
+    @property
+    def condition_stats(self) -> Tuple[ConditionStats, ...]:
+        """The statistics of the conditions in their current order, empty until adaptive ordering ran them."""
+        chain = self.registry.condition_chain
+        return chain.stats if chain is not None else ()
+
+    def __repr__(self) -> str:
+        state = "active" if self.active else "cancelled"
+        return f"Subscription({self.registry}, {state})"
+
+
+# A dispatch plan entry: the weak reference to the callback, its type, its conditions paired with
+# whether they are shared with other callbacks of the plan, and the registry itself.
+DispatchEntry = Tuple[Callable[[], Any], FunctionTypes, Tuple[ConditionPair, ...], BCR]
+# attribute names of a where filter -> (getter of those attributes, values -> entries filtering on them)
+WhereIndex = Dict[
+    Tuple[str, ...],
+    Tuple[Callable[[Any], Any], Dict[Any, Tuple[DispatchEntry, ...]]],
+]
+
+
+class DispatchPlan(tuple):
+    """The compiled callbacks of an event type in dispatch order.
+    The callbacks registered with a where filter are not part of the tuple,
+    they are indexed in where by the attribute values they expect instead."""
+
+    where: WhereIndex = {}
+    # conditions attached to several callbacks of the plan, evaluated once per emitted event
+    shared_conditions: frozenset = frozenset()
+
+    def __bool__(self):
+        return len(self) > 0 or bool(self.where)
+
+
+class CoalesceRule:
+    """How the events of a type are coalesced: events with the same key supersede each other until they are released."""
+
+    __slots__ = ("key", "window", "debounce")
+
+    def __init__(
+        self,
+        key: Callable[[Any], Any] | None,
+        window: float | None,
+        debounce: bool,
+    ) -> None:
+        self.key = key
+        self.window = window
+        self.debounce = debounce
+
+
+class PendingEvent:
+    """The latest event of a coalescing key and when it is due, None until the next flush."""
+
+    __slots__ = ("event", "deadline")
+
+    def __init__(self, event, deadline: float | None) -> None:
+        self.event = event
+        self.deadline = deadline
+
+
+def _normalize_where(where: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    """Check a where filter and turn it into attribute name and value pairs sorted by name."""
+    if not where:
+        raise ValueError("where must map at least one event attribute to a value")
+    for name, value in where.items():
+        if not isinstance(name, str):
+            raise ValueError(f"Got {name!r} in where (expect an attribute name)")
+        try:
+            hash(value)
+        except TypeError:
+            raise ValueError(f"Got unhashable {value!r} for {name} in where") from None
+    return tuple(sorted(where.items(), key=lambda item: item[0]))
+
+
+def _match_where(event, plan: DispatchPlan) -> Iterable[DispatchEntry]:
+    """The entries of plan in dispatch order, with the where filtered ones matching event merged in."""
+    matched = []
+    for getter, index in plan.where.values():
+        try:
+            entries = index.get(getter(event))
+        except (
+            AttributeError,
+            TypeError,
+        ):  # missing or unhashable attributes match nothing
+            continue
+        if entries:
+            matched.extend(entries)
+    if not matched:
+        return plan
+    matched.sort(key=_dispatch_entry_order)
+    return heapq.merge(plan, matched, key=_dispatch_entry_order) if plan else matched
+
+
+def _is_shared(condition: Callable, shared: frozenset) -> bool:
+    try:
+        return condition in shared
+    except TypeError:  # unhashable callables are never shared
+        return False
+
+
+def _dispatch_entry_order(entry: DispatchEntry) -> Tuple[int, int]:
+    return _dispatch_order(entry[3])
+
+
 class BaseEventManager(ABC, Generic[BCR, BCP, E]):
     _subscriptions: Dict[Type[E], List[BCR]] = defaultdict(list)
+    # compiled from _subscriptions on demand and dropped whenever _subscriptions changes.
+    # The dict is copied on write and never mutated once published, so emit reads it without locking.
+    _dispatch_plans: Dict[Type[E], DispatchPlan] = {}
     _callqueue = None
     _subscription_lock = None
     _callqueue_lock = None
+    _registration_order = None
+    # func_key -> registrations of that function, so that unsubscribing only touches the affected entries
+    _registrations: Dict[int | Tuple[int, int], List[BCR]] = {}
+    # registrations whose callback was collected, filled by weakref callbacks and pruned on the next emit
+    _dead_registrations: Deque[BCR] = deque()
+    pruned_registrations = 0
+    # capacity of the callqueue (0 is unbounded) and what to do with callbacks beyond it
+    maxsize = 0
+    overflow = OVERFLOW_POLICY.BLOCK
+    dropped_events = 0
+    blocked_events = 0
+    # event type -> how its events are coalesced, copied on write
+    _coalescing: Dict[type, CoalesceRule] = {}
+    # (event type, key) -> the latest event of that key waiting to be released, in arrival order
+    _pending_events: Dict[Tuple[type, Any], PendingEvent] = {}
+    coalesced_events = 0
+    # record how often and how fast conditions reject and reorder them every adapt_interval checks
+    adaptive_conditions = False
+    adapt_interval = 1000
+    # only the first adapt_sample checks of every interval are timed and counted, the others run untimed
+    adapt_sample = 100
+    # collected between enable_metrics() and disable_metrics(), read with stats()
+    metrics: ManagerMetrics | None = None
     halted = False
+    # log every step of emit and dispatch, costly even when loguru has no sinks so it is off by default
+    trace = False
+    _hierarchical = False
+
+    @property
+    def hierarchical(self) -> bool:
+        """Whether subscribing to an event type also receives the events of its subclasses."""
+        return self._hierarchical
+
+    @hierarchical.setter
+    def hierarchical(self, value: bool):
+        self._hierarchical = bool(value)
+        self._invalidate_dispatch_plans()
 
     @property
     @abstractmethod
@@ -171,6 +566,91 @@ class BaseEventManager(ABC, Generic[BCR, BCP, E]):
     def _set_subscriptions(self, subscriptions: Dict[Type[E], List[BCR]]):
         """Wrap this function with lock in subclass"""
         self._subscriptions = subscriptions
+        self._invalidate_dispatch_plans()
+
+    def _invalidate_dispatch_plans(self, event_type: Type[E] | None = None):
+        """Drop the compiled plan of event_type (or all of them if event_type is None).
+        In hierarchical mode the plans of the subclasses of event_type are dropped as well."""
+        plans = self._dispatch_plans
+        if event_type is None:
+            self._dispatch_plans = {}
+        elif self._hierarchical:
+            self._dispatch_plans = {
+                cached_type: plan
+                for cached_type, plan in plans.items()
+                if not issubclass(cached_type, event_type)
+            }
+        elif event_type in plans:
+            self._dispatch_plans = {
+                cached_type: plan
+                for cached_type, plan in plans.items()
+                if cached_type is not event_type
+            }
+
+    def _resolve_callbacks(self, event_type: Type[E]) -> List[BCR]:
+        """Collect the callbacks of event_type, walking its MRO in hierarchical mode."""
+        if not self._hierarchical:
+            return list(self._subscriptions.get(event_type, ()))
+        lists = [
+            tuple(self._subscriptions[base])
+            for base in event_type.__mro__
+            if base in self._subscriptions
+        ]
+        if len(lists) == 1:
+            return list(lists[0])
+        # each list is already in dispatch order
+        return list(heapq.merge(*lists, key=_dispatch_order))
+
+    def _compile_dispatch_plan(self, event_type: Type[E]) -> DispatchPlan:
+        """Compile and publish the plan of event_type. Wrap this function with lock in subclass."""
+        entries = []
+        where: Dict[Tuple[str, ...], Dict[Any, List[DispatchEntry]]] = {}
+        callbacks = self._resolve_callbacks(event_type)
+        condition_uses: Dict[Callable, int] = defaultdict(int)
+        for callback in callbacks:
+            for condition in callback.conditions:
+                try:
+                    condition_uses[condition] += 1
+                except TypeError:  # unhashable callables are never shared
+                    pass
+        shared = frozenset(
+            condition for condition, uses in condition_uses.items() if uses > 1
+        )
+        for callback in callbacks:
+            # flag the shared conditions here so that emit never hashes the others
+            conditions = tuple(
+                (condition, bool(shared) and _is_shared(condition, shared))
+                for condition in callback.conditions
+            )
+            entry = (callback._func_ref, callback.func_type, conditions, callback)
+            if callback.where is None:
+                entries.append(entry)
+            else:
+                names = tuple(name for name, _ in callback.where)
+                values = tuple(value for _, value in callback.where)
+                # attrgetter of one name returns the value itself
+                if len(names) == 1:
+                    values = values[0]
+                where.setdefault(names, {}).setdefault(values, []).append(entry)
+        plan = DispatchPlan(entries)
+        if where:
+            plan.where = {
+                names: (
+                    attrgetter(*names),
+                    {values: tuple(found) for values, found in index.items()},
+                )
+                for names, index in where.items()
+            }
+        if shared:
+            plan.shared_conditions = shared
+        self._dispatch_plans = {**self._dispatch_plans, event_type: plan}
+        return plan
+
+    def _get_dispatch_plan(self, event_type: Type[E]) -> DispatchPlan:
+        plan = self._dispatch_plans.get(event_type)
+        if plan is None:
+            plan = self._compile_dispatch_plan(event_type)
+        return plan
 
     @abstractmethod
     def _append_to_callqueue(self, callback: BCP): ...
@@ -190,16 +670,85 @@ class BaseEventManager(ABC, Generic[BCR, BCP, E]):
         self.halted = True
 
     def _remove_subscriptions(self, filter_func: Callable[[Type[E], BCR], bool]):
+        """Rebuild the subscriptions without the ones matching filter_func, this walks every registration."""
         new_subscriptions = defaultdict(list)
         for event_type, callbacks in self._subscriptions.items():
             for cb in callbacks:
                 if not filter_func(event_type, cb):
                     new_subscriptions[event_type].append(cb)
                 else:
-                    common_logger.debug(f"Removing subscription: {cb}")
+                    if self.trace:
+                        common_logger.debug(f"Removing subscription: {cb}")
+                    self._unindex_registration(cb)
 
         self._set_subscriptions(new_subscriptions)
 
+    def _clear_subscriptions(self):
+        """Drop every registration. Wrap with lock in subclass."""
+        for registrations in self._registrations.values():
+            for callback in registrations:
+                callback.func_key = None
+        self._registrations.clear()
+        self._dead_registrations.clear()
+        self._subscriptions.clear()
+        self._invalidate_dispatch_plans()
+
+    def _index_registration(self, callback: BCR):
+        callback.func_key = get_function_key(callback.func)
+        self._registrations.setdefault(callback.func_key, []).append(callback)
+        dead_registrations = self._dead_registrations
+        # the weakref callback may run in any thread during garbage collection, so it only queues the registration
+        callback._watch(
+            lambda _, callback=callback: dead_registrations.append(callback)
+        )
+
+    def _prune_dead_registrations(self):
+        """Remove the registrations whose callback has been collected."""
+        while self._dead_registrations:
+            try:
+                callback = self._dead_registrations.popleft()
+            except IndexError:  # drained by another thread
+                break
+            if self._remove_registration(callback):
+                self.pruned_registrations += 1
+
+    def _unindex_registration(self, callback: BCR):
+        registrations = self._registrations.get(callback.func_key)
+        if registrations is not None:
+            _remove_identical(registrations, callback)
+            if not registrations:
+                del self._registrations[callback.func_key]
+        callback.func_key = None
+
+    def _remove_registration(self, callback: BCR) -> bool:
+        """Remove a single registration, touching only its event type and its function. Wrap with lock in subclass."""
+        if callback.func_key is None:
+            return False
+        self._unindex_registration(callback)
+        callbacks = self._subscriptions.get(callback.event_type)
+        if callbacks is not None:
+            # the callbacks are sorted by dispatch order and no two of them share a key
+            index = bisect_left(
+                callbacks, _dispatch_order(callback), key=_dispatch_order
+            )
+            if index < len(callbacks) and callbacks[index] is callback:
+                del callbacks[index]
+            if not callbacks:
+                del self._subscriptions[callback.event_type]
+        self._invalidate_dispatch_plans(callback.event_type)
+        # formatting the registry formats its instance too, only pay for it when tracing
+        if self.trace:
+            common_logger.debug(f"Removing subscription: {callback}")
+        return True
+
+    def _registrations_of(self, func: Callable[[E], Any]) -> List[BCR]:
+        """Find the registrations of func through the reverse index."""
+        return [
+            callback
+            for callback in self._registrations.get(get_function_key(func), ())
+            if callback.func == func
+        ]
+
     def _unsubscribe_check_args(
         self, func: Callable[[E], Any] | None, event_type: Type[E] | None
     ):
@@ -221,14 +770,18 @@ class BaseEventManager(ABC, Generic[BCR, BCP, E]):
                     f"No subscriptions for {event_type} found, skipping."
                 )
                 return
-            self._remove_subscriptions(lambda e, c: e == event_type and c == func)
+            for callback in self._registrations_of(func):
+                if callback.event_type == event_type:
+                    self._remove_registration(callback)
             common_logger.debug(f"Removed subscription for {event_type} and {func}")
         elif func:
-            self._remove_subscriptions(lambda e, c: c == func)
+            for callback in self._registrations_of(func):
+                self._remove_registration(callback)
             common_logger.debug(f"Removed all callbacks for {func}")
         elif event_type:
             if event_type in self._subscriptions:
-                self._remove_subscriptions(lambda e, c: e == event_type)
+                for callback in tuple(self._subscriptions[event_type]):
+                    self._remove_registration(callback)
                 common_logger.debug(f"Cleared all subscriptions for {event_type}")
 
     @abstractmethod
@@ -240,15 +793,56 @@ class BaseEventManager(ABC, Generic[BCR, BCP, E]):
         func: Callable[[E], Any],
         event_type: Type[E],
         *conditions: Callable[[E], bool],
-    ):
-        """Wrap this function with lock in subclass"""
+        parallel: bool = False,
+        process: bool = False,
+        priority: int = 0,
+        where: Dict[str, Any] | None = None,
+        rate_limit: float | None = None,
+        burst: int = 1,
+        throttle: float | None = None,
+        trailing: bool = False,
+    ) -> Subscription[BCR]:
+        """Wrap this function with lock in subclass.
+        where maps event attribute names to the values they must equal for func to be called,
+        these filters are looked up in a hash table instead of being called like conditions.
+        rate_limit (events per second, with bursts of burst events) or throttle (seconds between calls,
+        delivering the last skipped event at the end of the interval if trailing) bound how often func is called."""
+        if rate_limit is not None and throttle is not None:
+            raise ValueError("Use either rate_limit or throttle, not both")
+        limiter = None
+        if rate_limit is not None:
+            limiter = TokenBucket(rate_limit, burst)
+        elif throttle is not None:
+            limiter = Throttle(throttle, trailing)
         callback: BCR = self.registry_class(
             func=func,
             event_type=event_type,
             conditions=conditions,
         )
-        self._subscriptions[callback.event_type].append(callback)
-        common_logger.debug(f"Registered {callback}")
+        # the function type is only checked here, calls trust it
+        if not callback._func_type_valid():
+            callback._report_function()
+        callback.order = next(self._registration_order)
+        callback.parallel = parallel
+        callback.process = process
+        callback.priority = priority
+        if self.metrics is not None:
+            callback.metrics = HandlerMetrics()
+        if where is not None:
+            callback.where = _normalize_where(where)
+        if limiter is not None:
+            if isinstance(limiter, Throttle) and trailing:
+                limiter.on_deferred = lambda _, callback=callback: self._on_deferred(
+                    callback
+                )
+            callback.limiter = limiter
+        # the callbacks of an event type are kept in dispatch order so that plans never need sorting
+        insort(self._subscriptions[callback.event_type], callback, key=_dispatch_order)
+        self._index_registration(callback)
+        self._invalidate_dispatch_plans(callback.event_type)
+        if self.trace:
+            common_logger.debug(f"Registered {callback}")
+        return Subscription(self, callback)
 
     def unsubscribe(
         self,
@@ -260,43 +854,322 @@ class BaseEventManager(ABC, Generic[BCR, BCP, E]):
 
     def _emit_check(self, event: E):
         if self.halted:
-            common_logger.debug("Event manager is halted, skipping.")
+            if self.trace:
+                common_logger.debug("Event manager is halted, skipping.")
             return False, event
-        if not is_instance_and_subclass(event):
+        event_type = type(event)
+        # a type with a compiled plan has already been validated
+        if event_type not in self._dispatch_plans and not is_instance_and_subclass(
+            event
+        ):
             common_logger.warning(f"Skipping non-instance event: {event}")
             return False, event
-        event_type = type(event)
         if not event_type.enabled:
-            common_logger.debug(f"Skipping disabled event {event_type.__qualname__}")
+            if self.trace:
+                common_logger.debug(
+                    f"Skipping disabled event {event_type.__qualname__}"
+                )
             return False, event_type
         return True, event_type
 
+    def _prepare_processings(
+        self, event: E, plan: DispatchPlan, trace: bool
+    ) -> List[BCP]:
+        """Turn the plan entries whose conditions accept event into processings."""
+        processings = []
+        resolved = self.processing_class._resolved
+        entries = _match_where(event, plan) if plan.where else plan
+        if self.adaptive_conditions:
+            return self._prepare_adaptive_processings(event, entries, trace)
+        checked: Dict[Callable, Any] = {}
+        for func_ref, _, conditions, callback in entries:
+            if func_ref() is None:
+                continue
+            for condition, shared in conditions:
+                if shared:
+                    try:
+                        passed = checked[condition]
+                    except KeyError:
+                        passed = checked[condition] = condition(event)
+                else:
+                    passed = condition(event)
+                if not passed:
+                    if callback.metrics is not None:
+                        callback.metrics.rejections += 1
+                    if trace:
+                        common_logger.debug(
+                            f"Skipping {callback} due to condition {condition} not met."
+                        )
+                    break
+            else:
+                limiter = callback.limiter
+                if limiter is not None and not limiter.allow(event):
+                    if trace:
+                        common_logger.debug(f"Skipping {callback} due to {limiter}.")
+                    continue
+                processings.append(resolved(callback, event))
+        return processings
+
+    def _prepare_adaptive_processings(
+        self,
+        event: E,
+        entries: Iterable[DispatchEntry],
+        trace: bool,
+    ) -> List[BCP]:
+        """_prepare_processings recording the statistics of the conditions and reordering them."""
+        processings = []
+        resolved = self.processing_class._resolved
+        checked: Dict[Callable, Any] = {}
+        interval = self.adapt_interval
+        sample = self.adapt_sample
+        for func_ref, _, conditions, callback in entries:
+            if func_ref() is None:
+                continue
+            if conditions:
+                chain = callback.condition_chain
+                if chain is None:
+                    chain = callback.condition_chain = ConditionChain(
+                        callback.conditions
+                    )
+                passed = True
+                # only a sample of the checks of every interval is timed, timing all of them costs more than it saves
+                sampled = chain.checks < sample
+                ordered = chain.ordered
+                if chain.source is not conditions:
+                    ordered = chain.order(conditions)
+                for condition, shared, stats in ordered:
+                    if shared and condition in checked:
+                        passed = checked[condition]
+                    elif not sampled:
+                        passed = condition(event)
+                        if shared:
+                            checked[condition] = passed
+                    else:
+                        start = perf_counter()
+                        passed = condition(event)
+                        stats.total_time += perf_counter() - start
+                        stats.evaluations += 1
+                        if not passed:
+                            stats.rejections += 1
+                        if shared:
+                            checked[condition] = passed
+                    if not passed:
+                        if trace:
+                            common_logger.debug(
+                                f"Skipping {callback} due to condition {condition} not met."
+                            )
+                        break
+                chain.checks += 1
+                if chain.checks >= interval:
+                    chain.reorder()
+                if not passed:
+                    if callback.metrics is not None:
+                        callback.metrics.rejections += 1
+                    continue
+            limiter = callback.limiter
+            if limiter is not None and not limiter.allow(event):
+                continue
+            processings.append(resolved(callback, event))
+        return processings
+
+    def enable_metrics(self):
+        """Start collecting metrics, from zero if they were collected before. Wrap with lock in subclass.
+        Counters are kept per event type and per registration, latencies in the fixed buckets of metrics.LATENCY_BUCKETS."""
+        self.metrics = ManagerMetrics()
+        for registrations in self._registrations.values():
+            for callback in registrations:
+                callback.metrics = HandlerMetrics()
+
+    def disable_metrics(self):
+        """Stop collecting metrics and drop the ones collected. Wrap with lock in subclass."""
+        self.metrics = None
+        for registrations in self._registrations.values():
+            for callback in registrations:
+                callback.metrics = None
+
+    def stats(self) -> Dict[str, Any]:
+        """A snapshot of the counters of the manager and, while metrics are enabled, of the metrics collected.
+        Wrap with lock in subclass."""
+        stats: Dict[str, Any] = {
+            "pruned_registrations": self.pruned_registrations,
+            "dropped_events": self.dropped_events,
+            "blocked_events": self.blocked_events,
+            "coalesced_events": self.coalesced_events,
+        }
+        metrics = self.metrics
+        if metrics is None:
+            return stats
+        # keyed by the types themselves, generated event classes may share both module and name
+        stats["emits"] = dict(metrics.emits)
+        stats["queue_high_water"] = metrics.queue_high_water
+        handlers = stats["handlers"] = []
+        for event_type, callbacks in self._subscriptions.items():
+            for callback in callbacks:
+                handler_metrics = callback.metrics
+                func = callback.func
+                if handler_metrics is None or func is None:
+                    continue
+                handlers.append(
+                    {
+                        "handler": _func_name(func),
+                        "event_type": event_type,
+                        "calls": handler_metrics.calls,
+                        "errors": handler_metrics.errors,
+                        "rejections": handler_metrics.rejections,
+                        "mean_time": handler_metrics.mean_time,
+                        "latency": handler_metrics.histogram(),
+                    }
+                )
+        return stats
+
+    def coalesce(
+        self,
+        event_type: Type[E],
+        key: Callable[[E], Any] | None = None,
+        window: float | None = None,
+        debounce: bool = False,
+    ):
+        """Coalesce the events of event_type: an emitted event is held back and superseded by
+        the later events of the same key (all events of the type share one key by default).
+        The latest event of a key is released window seconds after the first one arrived
+        (after the last one with debounce) or, without a window, on the next flush."""
+        if not is_class_and_subclass(event_type):
+            raise ValueError(f"Got {event_type} (expect an inheritor of Event)")
+        if window is not None and window < 0:
+            raise ValueError(f"Got negative window {window}")
+        self._coalescing = {
+            **self._coalescing,
+            event_type: CoalesceRule(key, window, debounce),
+        }
+
+    def uncoalesce(self, event_type: Type[E]):
+        """Stop coalescing event_type, the events already held are still released as configured."""
+        self._coalescing = {
+            t: rule for t, rule in self._coalescing.items() if t is not event_type
+        }
+
+    def _hold_event(self, event: E, rule: CoalesceRule):
+        """Hold event back until its key is released. Wrap this function with lock in subclass."""
+        event_type = type(event)
+        key = (event_type, rule.key(event) if rule.key is not None else None)
+        window = rule.window
+        pending = self._pending_events.get(key)
+        if pending is None:
+            deadline = monotonic() + window if window is not None else None
+            pending = self._pending_events[key] = PendingEvent(event, deadline)
+            self._on_event_held(key, pending, rule)
+        else:
+            pending.event = event
+            self.coalesced_events += 1
+            if rule.debounce and window is not None:
+                pending.deadline = monotonic() + window
+        if self.trace:
+            common_logger.debug(f"Holding {event} back until {key} is released")
+
+    def _on_event_held(self, key: Tuple[type, Any], pending: PendingEvent, rule):
+        """Called when a coalescing key starts holding an event."""
+
+    def _take_pending_events(self, now: float | None = None) -> List[E]:
+        """Remove and return the held events due at now, every held event if now is None.
+        Wrap this function with lock in subclass."""
+        if now is None:
+            pending_events, self._pending_events = self._pending_events, {}
+            return [pending.event for pending in pending_events.values()]
+        due = []
+        for key, pending in list(self._pending_events.items()):
+            if pending.deadline is not None and pending.deadline <= now:
+                del self._pending_events[key]
+                due.append(pending.event)
+        return due
+
+    def _on_deferred(self, callback: BCR):
+        """Called when the trailing throttle of callback starts holding an event."""
+
+    def _release_deferred(self, callback: BCR) -> BCP | None:
+        """The processing of the event held by the trailing throttle of callback if it is due."""
+        event = callback.limiter.take_due()
+        if event is None or callback._func_ref() is None:
+            return None
+        if self.trace:
+            common_logger.debug(f"Releasing {event} deferred by {callback.limiter}")
+        return self.processing_class._resolved(callback, event)
+
+    def _prepare_batch(
+        self, events: Iterable[E], coalesce: bool = True
+    ) -> Iterator[List[BCP]]:
+        """Yield the processings of each event of a batch, checking and resolving each event type once.
+        An event is prepared only once the processings of the previous one are dispatched,
+        so that its conditions and limiters see what the handlers of the previous events did."""
+        events = list(events)
+        if self.halted:
+            for _ in events:
+                yield []
+            return
+        if self._dead_registrations:
+            self._prune_dead_registrations()
+        trace = self.trace
+        coalescing = self._coalescing if coalesce else None
+        # released events were counted when they were emitted
+        metrics = self.metrics if coalesce else None
+        plans: Dict[type, DispatchPlan | None] = {}
+        for event in events:
+            event_type = type(event)
+            if event_type in plans:
+                plan = plans[event_type]
+            else:
+                valid, _ = self._emit_check(event)
+                plan = plans[event_type] = (
+                    self._get_dispatch_plan(event_type) if valid else None
+                )
+            if metrics is not None and plan is not None:
+                metrics.emits[event_type] += 1
+            if plan is not None and coalescing and event_type in coalescing:
+                self._hold_event(event, coalescing[event_type])
+                yield []
+                continue
+            if not plan:
+                yield []
+                continue
+            if trace:
+                common_logger.debug(f"Emitting {event}")
+            yield self._prepare_processings(event, plan, trace)
+
     def emit(self, event: E) -> List:
         valid, event_type = self._emit_check(event)
         if not valid:
             return []
-        common_logger.debug(f"Emitting {event}")
-        if event_type in self._subscriptions:
-            callbacks = self._subscriptions[event_type]
-            common_logger.debug(
-                f"Processing {event_type.__qualname__} ({len(callbacks)} callbacks)"
-            )
-            for callback in callbacks:
-                if not callback._check_conditions(event):
-                    common_logger.debug(
-                        f"Skipping {callback} due to conditions not met."
-                    )
-                    continue
-                self._append_to_callqueue(
-                    self.processing_class(
-                        func=callback.func,
-                        event=event,
-                        conditions=callback.conditions,
-                    )
+        if self.metrics is not None:
+            self.metrics.emits[event_type] += 1
+        if self._coalescing and event_type in self._coalescing:
+            self._hold_event(event, self._coalescing[event_type])
+            return []
+        if self._dead_registrations:
+            self._prune_dead_registrations()
+        trace = self.trace
+        if trace:
+            common_logger.debug(f"Emitting {event}")
+        plan = self._get_dispatch_plan(event_type)
+        if plan:
+            if trace:
+                common_logger.debug(
+                    f"Processing {event_type.__qualname__} ({len(plan)} callbacks)"
                 )
+            return self._dispatch_processings(
+                self._prepare_processings(event, plan, trace)
+            )
 
         return self._process_callqueue()
 
+    def _dispatch_processings(self, processings: List[BCP]) -> List:
+        """Call the processings of an emitted event through the callqueue."""
+        results = []
+        for processing in processings:
+            if self._append_to_callqueue(processing) is False:
+                # the callqueue is full and the policy blocks, make room by processing it here
+                results.extend(self._process_callqueue())
+                self._append_to_callqueue(processing)
+        return results + self._process_callqueue()
+
 
 def subscribe_method(*args, **kwargs):
     """subscribe dispatcher decorator.
@@ -304,6 +1177,7 @@ def subscribe_method(*args, **kwargs):
     If the second argument is a function, then functions after that will be registered as conditions.
     If the second argument is another event, then events after that will be registered as multi-callbacks.
     If arguments after the second argument is not same, then it will raise a ValueError.
+    Keyword arguments are passed to register() when the class is instantiated.
     """
     strategy = get_subscription_strategy(*args, **kwargs)
     if strategy == SUBSCRIPTION_STRATEGY.EVENTS:
@@ -313,7 +1187,9 @@ def subscribe_method(*args, **kwargs):
                 func._subscriptions = defaultdict(list)  # pyright: ignore[reportFunctionMemberAccess] (function attribute does not support type hint)
             for event_type in args:
                 func._subscriptions[event_type].append(  # pyright: ignore[reportFunctionMemberAccess] (function attribute does not support type hint)
-                    PostCallbackRegistry(func=func, event_type=event_type)
+                    PostCallbackRegistry(
+                        func=func, event_type=event_type, options=kwargs
+                    )
                 )
                 common_logger.debug(
                     f"{func.__qualname__}._subscriptions[{event_type}] is set."
@@ -327,10 +1203,13 @@ def subscribe_method(*args, **kwargs):
 
         def conditions_decorator(func: Callable[[E], Any] | Callable[[Any, E], Any]):
             if not hasattr(func, "_subscriptions"):
-                func._subscriptions = {}  # pyright: ignore[reportFunctionMemberAccess] (function attribute does not support type hint)
+                func._subscriptions = defaultdict(list)  # pyright: ignore[reportFunctionMemberAccess] (function attribute does not support type hint)
             func._subscriptions[event_type].append(  # pyright: ignore[reportFunctionMemberAccess] (function attribute does not support type hint)
                 PostCallbackRegistry(
-                    func=func, event_type=event_type, conditions=conditions
+                    func=func,
+                    event_type=event_type,
+                    conditions=conditions,
+                    options=kwargs,
                 )
             )
             common_logger.debug(
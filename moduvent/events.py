@@ -1,6 +1,6 @@
 from collections import defaultdict
 from types import new_class
-from typing import Any, Type, TypeVar
+from typing import Any, Dict, Tuple, Type, TypeVar
 from uuid import uuid4 as uuid
 
 
@@ -18,8 +18,10 @@ class MutedContext:
 
 
 class Event:
-    """Base event class"""
+    """Base event class.
+    It has no instance attributes of its own, subclasses declaring __slots__ get compact instances without a __dict__."""
 
+    __slots__ = ()
     enabled: bool = True
 
     @classmethod
@@ -28,38 +30,102 @@ class Event:
         return MutedContext(cls)
 
     def __str__(self) -> str:
-        # get all attributes without the ones starting with __
-        attrs = [f"{k}={v}" for k, v in self.__dict__.items() if not k.startswith("__")]
+        # get all attributes without the ones starting with __, slots included
+        attrs = [f"{k}={v}" for k, v in _attributes(self) if not k.startswith("__")]
         return f"{type(self).__qualname__}({', '.join(attrs)})"
 
+    def __reduce_ex__(self, protocol):
+        # classes generated by EventFactory cannot be pickled by reference, so their events are rebuilt from the base class and the name
+        event_class = type(self)
+        factory_key = event_class.__dict__.get("_factory_key")
+        # only the first class generated for a key is rebuilt from it, the others are copied by reference
+        if factory_key is None or _factory_classes.get(factory_key) is not event_class:
+            return super().__reduce_ex__(protocol)
+        slotted = "__slots__" in event_class.__dict__
+        return _new_factory_event, (*factory_key, slotted), self.__getstate__()
+
+
+def _attributes(event: Event):
+    """The attributes of event in __slots__ order and then __dict__ order, skipping unset slots."""
+    for cls in reversed(type(event).__mro__):
+        slots = cls.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name in ("__dict__", "__weakref__"):
+                continue
+            try:
+                yield name, getattr(event, name)
+            except AttributeError:
+                continue
+    yield from getattr(event, "__dict__", {}).items()
+
 
 E = TypeVar("E", bound=Event)
 
+# (base class, name) -> class generated by an EventFactory
+_factory_classes: Dict[Tuple[Type[Event], str], Type[Event]] = {}
+
+
+def _generate_class(base_class: Type[E], name: str, slotted: bool) -> Type[E]:
+    def exec_body(namespace):
+        if slotted:
+            namespace["__slots__"] = ()
+
+    event_class = new_class(name, (base_class,), exec_body=exec_body)
+    event_class._factory_key = (base_class, name)  # pyright: ignore[reportAttributeAccessIssue] (set on generated classes only)
+    return event_class
+
+
+def _factory_class(base_class: Type[E], name: str, slotted: bool = False) -> Type[E]:
+    """Return the class generated for name from base_class, creating it if this process has not generated it yet."""
+    key = (base_class, name)
+    if key not in _factory_classes:
+        _factory_classes[key] = _generate_class(base_class, name, slotted)
+    return _factory_classes[key]
+
+
+def _new_factory_event(base_class: Type[E], name: str, slotted: bool = False) -> E:
+    """Unpickle helper of the events of generated classes, the state is restored by pickle."""
+    event_class = _factory_class(base_class, name, slotted)
+    return event_class.__new__(event_class)
+
 
 class EventFactory(dict[str, Type[E]]):
     """A factory to create new event classes inheriting from given base class but with customized name."""
 
     base_class: Type[E]
+    # generate classes with empty __slots__, so that their events have no __dict__ if the base class is slotted
+    slotted: bool = False
 
     @classmethod
-    def create(cls, base_class: Type[E] = Event) -> "EventFactory":
+    def create(
+        cls, base_class: Type[E] = Event, slotted: bool = False
+    ) -> "EventFactory":
         if not issubclass(base_class, Event):
             raise TypeError("base_class must be a subclass of Event")
         instance = cls()
         instance.base_class = base_class
+        instance.slotted = slotted
         return instance
 
-    def new(self, name: str = "") -> Type[E]:
+    def new(self, name: str = "", slotted: bool | None = None) -> Type[E]:
+        """Return the class of name, generating it on first use (slotted defaults to the one of the factory)."""
         if not name:
             name = f"{self.base_class.__name__}_{str(uuid())}"
         if name not in self:
-            self[name] = new_class(name, (self.base_class,))
+            if slotted is None:
+                slotted = self.slotted
+            event_class = _generate_class(self.base_class, name, slotted)
+            # the first class generated for a name is the one unpickled events get
+            _factory_classes.setdefault(event_class._factory_key, event_class)
+            self[name] = event_class
 
         return self[name]
 
 
-class Signal(Event):
-    """Signal is an event with only a sender"""
+class SlottedSignal(Event):
+    """Signal laid out in __slots__, its instances have no __dict__ and cannot be weakly referenced."""
+
+    __slots__ = ("sender",)
 
     def __init__(self, sender: Any = None):
         self.sender = sender
@@ -68,18 +134,35 @@ class Signal(Event):
         return f"Signal({self.__class__.__name__}, sender={self.sender})"
 
 
+class Signal(SlottedSignal):
+    """Signal is an event with only a sender"""
+
+    # keep the __dict__ and weak references of the events, SlottedSignal is the compact layout
+    __slots__ = ("__dict__", "__weakref__")
+
+
 SignalFactory = EventFactory.create(Signal)
+SlottedSignalFactory = EventFactory.create(SlottedSignal, slotted=True)
 
 
-class DataEvent(Signal):
-    """An event with data and a sender"""
+class SlottedDataEvent(SlottedSignal):
+    """DataEvent laid out in __slots__, its instances have no __dict__ and cannot be weakly referenced."""
+
+    __slots__ = ("data",)
 
     def __init__(self, data, sender: object = None):
         self.data = data
         self.sender = sender
 
 
+class DataEvent(SlottedDataEvent, Signal):
+    """An event with data and a sender"""
+
+    __slots__ = ()
+
+
 DataEventFactory = EventFactory.create(DataEvent)
+SlottedDataEventFactory = EventFactory.create(SlottedDataEvent, slotted=True)
 
 
 class EventMeta(type):
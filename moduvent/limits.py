@@ -0,0 +1,113 @@
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable
+
+
+class TokenBucket:
+    """Let through rate events per second on average and bursts of up to burst events."""
+
+    __slots__ = ("rate", "burst", "tokens", "updated", "skipped", "_lock")
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError(
+                f"Got rate {rate} (expect a positive number of events per second)"
+            )
+        if burst < 1:
+            raise ValueError(f"Got burst {burst} (expect at least 1)")
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = monotonic()
+        self.skipped = 0
+        self._lock = Lock()
+
+    def allow(self, event) -> bool:
+        with self._lock:
+            now = monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            self.skipped += 1
+            return False
+
+    def __repr__(self) -> str:
+        return (
+            f"TokenBucket(rate={self.rate}, burst={self.burst}, skipped={self.skipped})"
+        )
+
+
+class Throttle:
+    """Let through at most one event per interval seconds.
+    Leading throttles let the first event of an interval through and skip the others.
+    Trailing throttles also keep the last skipped event and hand it to on_deferred, to be released with take_due()."""
+
+    __slots__ = (
+        "interval",
+        "trailing",
+        "next_allowed",
+        "pending",
+        "skipped",
+        "deferred",
+        "on_deferred",
+        "_lock",
+    )
+
+    def __init__(self, interval: float, trailing: bool = False) -> None:
+        if interval <= 0:
+            raise ValueError(
+                f"Got interval {interval} (expect a positive number of seconds)"
+            )
+        self.interval = interval
+        self.trailing = trailing
+        self.next_allowed = 0.0
+        self.pending = None
+        self.skipped = 0
+        self.deferred = 0
+        # set by the event manager, called with the throttle when it starts holding an event
+        self.on_deferred: Callable[["Throttle"], Any] | None = None
+        self._lock = Lock()
+
+    def allow(self, event) -> bool:
+        with self._lock:
+            now = monotonic()
+            if now >= self.next_allowed:
+                if self.pending is not None:
+                    # the held event was not released in time, the new one supersedes it
+                    self.pending = None
+                    self.skipped += 1
+                self.next_allowed = now + self.interval
+                return True
+            if not self.trailing:
+                self.skipped += 1
+                return False
+            first = self.pending is None
+            if not first:
+                self.skipped += 1
+            self.pending = event
+        if first and self.on_deferred is not None:
+            self.on_deferred(self)
+        return False
+
+    def delay(self) -> float:
+        """Seconds until the held event is due."""
+        return max(0.0, self.next_allowed - monotonic())
+
+    def take_due(self):
+        """Remove and return the held event if its interval has elapsed, None otherwise."""
+        with self._lock:
+            now = monotonic()
+            if self.pending is None or now < self.next_allowed:
+                return None
+            event, self.pending = self.pending, None
+            self.next_allowed = now + self.interval
+            self.deferred += 1
+            return event
+
+    def __repr__(self) -> str:
+        edge = "trailing" if self.trailing else "leading"
+        return f"Throttle({self.interval}s, {edge}, skipped={self.skipped}, deferred={self.deferred})"
@@ -0,0 +1,59 @@
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict
+
+# upper bounds in seconds of the latency buckets, the last bucket counts the calls slower than all of them
+LATENCY_BUCKETS = (1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+LATENCY_LABELS = ("10us", "100us", "1ms", "10ms", "100ms", "1s", "+inf")
+
+
+class HandlerMetrics:
+    """What a registration did while metrics were enabled: calls, errors, condition rejections and call latency.
+    Counters are updated without locking, under concurrent emits they are approximate."""
+
+    __slots__ = ("calls", "errors", "rejections", "total_time", "buckets")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.rejections = 0
+        self.total_time = 0.0
+        self.buckets = [0] * len(LATENCY_LABELS)
+
+    def observe(self, elapsed: float) -> None:
+        """Count a call that took elapsed seconds."""
+        self.calls += 1
+        self.total_time += elapsed
+        self.buckets[bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def histogram(self) -> Dict[str, int]:
+        """The number of calls per latency bucket, labelled by the upper bound of the bucket."""
+        return dict(zip(LATENCY_LABELS, self.buckets))
+
+    def __repr__(self) -> str:
+        return (
+            f"HandlerMetrics(calls={self.calls}, errors={self.errors}, "
+            f"rejections={self.rejections}, mean_time={self.mean_time:.3g}s)"
+        )
+
+
+class ManagerMetrics:
+    """What an event manager did while metrics were enabled: emitted events per event type and callqueue depth.
+    Counters are updated without locking, under concurrent emits they are approximate."""
+
+    __slots__ = ("emits", "queue_high_water")
+
+    def __init__(self) -> None:
+        self.emits: Counter[type] = Counter()
+        self.queue_high_water = 0
+
+    def observe_queue(self, depth: int) -> None:
+        if depth > self.queue_high_water:
+            self.queue_high_water = depth
+
+    def __repr__(self) -> str:
+        return f"ManagerMetrics(emits={sum(self.emits.values())}, queue_high_water={self.queue_high_water})"
@@ -1,7 +1,16 @@
 from collections import defaultdict, deque
-from collections.abc import Callable
-from threading import RLock
-from typing import Any, Deque, Dict, Generic, List, Type
+from collections.abc import Callable, Iterable
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from itertools import count
+from queue import Full
+from threading import RLock, local
+from time import monotonic, perf_counter
+from typing import Any, Deque, Dict, Generic, List, Tuple, Type
 
 from loguru import logger
 
@@ -9,15 +18,21 @@ from .common import (
     BaseCallbackProcessing,
     BaseCallbackRegistry,
     BaseEventManager,
+    CoalesceRule,
+    DispatchPlan,
+    PendingEvent,
     PostCallbackRegistry,
+    Subscription,
 )
 from .events import E, EventMeta
-from .utils import SUBSCRIPTION_STRATEGY, get_subscription_strategy
+from .utils import OVERFLOW_POLICY, SUBSCRIPTION_STRATEGY, get_subscription_strategy
 
 moduvent_logger = logger.bind(source="moduvent_sync")
 
 
 class CallbackRegistry(BaseCallbackRegistry[E]):
+    __slots__ = ()
+
     def __eq__(self, value):
         return (
             super()._compare_attributes(value)
@@ -26,23 +41,120 @@ class CallbackRegistry(BaseCallbackRegistry[E]):
         )
 
 
-class CallbackProcessing(BaseCallbackProcessing[E], CallbackRegistry):
+class CallbackProcessing(BaseCallbackProcessing[E]):
+    __slots__ = ()
+    registry_class = CallbackRegistry
+
     def call(self):
-        if super().is_callable():
+        func = self._resolve_func()
+        if func is not None:
+            metrics = self.callback.metrics
+            start = perf_counter() if metrics is not None else 0.0
             try:
-                return self.func(self.event)
+                return func(self.event)
             except Exception as e:
+                if metrics is not None:
+                    metrics.errors += 1
                 moduvent_logger.exception(f"Error while processing {self}: {e}")
+            finally:
+                if metrics is not None:
+                    metrics.observe(perf_counter() - start)
+
+
+def _call_in_process(func: Callable[[E], Any], events: List[E]) -> List:
+    """Call func on a batch of events in a worker process."""
+    results = []
+    for event in events:
+        try:
+            results.append(func(event))
+        except Exception as e:
+            moduvent_logger.exception(
+                f"Error while processing {event} in a worker: {e}"
+            )
+            results.append(None)
+    return results
+
+
+class _ProcessResult:
+    """The result of one event of a batch submitted to the process pool."""
+
+    __slots__ = ("future", "index")
+
+    def __init__(self, future: Future, index: int):
+        self.future = future
+        self.index = index
+
+    def result(self):
+        return self.future.result()[self.index]
+
+
+def _future_result(future: Future | _ProcessResult, processing: CallbackProcessing):
+    """The result of a callback offloaded to a pool, None if it raised."""
+    try:
+        return future.result()
+    except Exception as e:
+        moduvent_logger.exception(f"Error while processing {processing}: {e}")
+        return None
 
 
 # We say that a subscription is the information that a method wants to be called back
 # and a registration is the process of adding a method to the list of callbacks for a particular event.
 class EventManager(BaseEventManager[CallbackRegistry, CallbackProcessing, E]):
-    def __init__(self):
+    def __init__(
+        self,
+        hierarchical: bool = False,
+        trace: bool = False,
+        parallel: bool = False,
+        executor: Executor | None = None,
+        max_workers: int | None = None,
+        process_executor: Executor | None = None,
+        process_workers: int | None = None,
+        process_batch_size: int = 64,
+        maxsize: int = 0,
+        overflow: OVERFLOW_POLICY | str = OVERFLOW_POLICY.BLOCK,
+        adaptive_conditions: bool = False,
+        adapt_interval: int = 1000,
+        adapt_sample: int = 100,
+        metrics: bool = False,
+    ):
         self._subscriptions: Dict[Type[E], List[CallbackRegistry]] = defaultdict(list)
-        self._callqueue: Deque[CallbackProcessing] = deque()
+        self._dispatch_plans: Dict[Type[E], DispatchPlan] = {}
+        self._registration_order = count()
+        self._registrations: Dict[int | Tuple[int, int], List[CallbackRegistry]] = {}
+        self._dead_registrations: Deque[CallbackRegistry] = deque()
+        self.pruned_registrations = 0
+        self._hierarchical = hierarchical
+        self.trace = trace
+        # every emitting thread drains its own callqueue so that threads do not serialize on a shared one
+        self._local = local()
         self._subscription_lock = RLock()
-        self._callqueue_lock = RLock()
+        # fan every callback out to the executor, otherwise only the subscriptions registered with parallel=True
+        self.parallel = parallel
+        self._executor = executor
+        self._owns_executor = executor is None
+        self.max_workers = max_workers
+        # the subscriptions registered with process=True run there, emit_many sends up to process_batch_size events per call
+        self._process_executor = process_executor
+        self._owns_process_executor = process_executor is None
+        self.process_workers = process_workers
+        self.process_batch_size = process_batch_size
+        # bound of each per-thread callqueue, see OVERFLOW_POLICY for what happens beyond it
+        self.maxsize = maxsize
+        self.overflow = OVERFLOW_POLICY(overflow)
+        self.dropped_events = 0
+        self.blocked_events = 0
+        self._coalescing: Dict[type, CoalesceRule] = {}
+        self._pending_events: Dict[Tuple[type, Any], PendingEvent] = {}
+        self.coalesced_events = 0
+        # registrations whose trailing throttle holds an event, released by pump()
+        self._deferred_callbacks: Dict[int, CallbackRegistry] = {}
+        # run the conditions of each registration in the order that rejects events the cheapest
+        self.adaptive_conditions = adaptive_conditions
+        self.adapt_interval = adapt_interval
+        self.adapt_sample = adapt_sample
+        # count emits, calls, errors and latencies, read them with stats()
+        if metrics:
+            self.enable_metrics()
 
     @property
     def registry_class(cls) -> Type[CallbackRegistry]:
@@ -52,43 +164,314 @@ class EventManager(BaseEventManager[CallbackRegistry, CallbackProcessing, E]):
     def processing_class(cls) -> Type[CallbackProcessing]:
         return CallbackProcessing
 
+    def unsubscribe(
+        self,
+        func: Callable[[E], Any] | None = None,
+        event_type: Type[E] | None = None,
+    ):
+        with self._subscription_lock:
+            return super().unsubscribe(func, event_type)
+
     def _set_subscriptions(self, subscriptions: Dict[Type[E], List[CallbackRegistry]]):
         with self._subscription_lock:
             return super()._set_subscriptions(subscriptions)
 
-    def _append_to_callqueue(self, callback: CallbackProcessing):
-        with self._callqueue_lock:
-            self._callqueue.append(callback)
+    def _remove_registration(self, callback: CallbackRegistry) -> bool:
+        with self._subscription_lock:
+            return super()._remove_registration(callback)
+
+    def _prune_dead_registrations(self):
+        with self._subscription_lock:
+            return super()._prune_dead_registrations()
+
+    def _compile_dispatch_plan(self, event_type: Type[E]):
+        # compiling and publishing under the lock keeps a stale plan from being published after an invalidation
+        with self._subscription_lock:
+            return super()._compile_dispatch_plan(event_type)
+
+    @property
+    def _callqueue(self) -> Deque[CallbackProcessing]:
+        try:
+            return self._local.callqueue
+        except AttributeError:
+            callqueue = self._local.callqueue = deque()
+            return callqueue
+
+    def _append_to_callqueue(self, callback: CallbackProcessing) -> bool:
+        """Queue callback, returning False if the callqueue is full and the overflow policy blocks."""
+        callqueue = self._callqueue
+        if self.maxsize and len(callqueue) >= self.maxsize:
+            overflow = self.overflow
+            if overflow is OVERFLOW_POLICY.BLOCK:
+                self.blocked_events += 1
+                return False
+            if overflow is OVERFLOW_POLICY.RAISE:
+                raise Full(
+                    f"Callqueue is full ({self.maxsize}), cannot queue {callback}"
+                )
+            self.dropped_events += 1
+            if overflow is OVERFLOW_POLICY.DROP_NEWEST:
+                if self.trace:
+                    moduvent_logger.debug(f"Callqueue is full, dropping {callback}")
+                return True
+            dropped = callqueue.popleft()
+            if self.trace:
+                moduvent_logger.debug(f"Callqueue is full, dropping {dropped}")
+        callqueue.append(callback)
+        if self.metrics is not None:
+            self.metrics.observe_queue(len(callqueue))
+        return True
+
+    def _check_callqueue_room(self, processings: List[CallbackProcessing]):
+        """Under the raise policy, raise queue.Full before queuing any callback of an emit that does not fit,
+        so that a failed emit leaves nothing behind in the callqueue."""
+        if not self.maxsize or self.overflow is not OVERFLOW_POLICY.RAISE:
+            return
+        if len(self._callqueue) + len(processings) > self.maxsize:
+            raise Full(
+                f"Callqueue is full ({self.maxsize}), cannot queue {len(processings)} callbacks"
+            )
 
     def _get_callqueue_length(self):
         return len(self._callqueue)
 
+    def enable_metrics(self):
+        with self._subscription_lock:
+            return super().enable_metrics()
+
+    def disable_metrics(self):
+        with self._subscription_lock:
+            return super().disable_metrics()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._subscription_lock:
+            return super().stats()
+
     def reset(self):
         with self._subscription_lock:
-            self._subscriptions.clear()
+            self._clear_subscriptions()
 
     def halt(self):
-        with self._callqueue_lock:
-            self._callqueue.clear()
+        """Clear the callqueue of the current thread."""
+        self._callqueue.clear()
 
     def _process_callqueue(self):
         if self.halted:
             return []
-        moduvent_logger.debug(f"Callqueue ({self._get_callqueue_length()}):")
-        for callback in self._callqueue:
-            moduvent_logger.debug(f"\t{callback}")
-        moduvent_logger.debug("Processing callqueue...")
+        return self._drain_callqueue()
+
+    def _drain_callqueue(self) -> List:
+        """Call everything in the callqueue of the current thread."""
+        trace = self.trace
+        if trace:
+            moduvent_logger.debug(f"Callqueue ({self._get_callqueue_length()}):")
+            for callback in self._callqueue:
+                moduvent_logger.debug(f"\t{callback}")
+            moduvent_logger.debug("Processing callqueue...")
         results = []
-        with self._callqueue_lock:
-            while self._callqueue:
-                callback = self._callqueue.popleft()
+        callqueue = self._callqueue
+        while callqueue:
+            callback = callqueue.popleft()
+            if trace:
                 moduvent_logger.debug(f"Calling {callback}")
+            try:
+                results.append(callback.call())
+            except Exception as e:
+                moduvent_logger.exception(f"Error while processing callback: {e}")
+                continue
+        if trace:
+            moduvent_logger.debug("End processing callqueue.")
+        return results
+
+    @property
+    def executor(self) -> Executor:
+        """The executor of parallel callbacks, a ThreadPoolExecutor of max_workers is created on first use."""
+        if self._executor is None:
+            with self._subscription_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="moduvent",
+                    )
+        return self._executor
+
+    @property
+    def process_executor(self) -> Executor:
+        """The executor of process callbacks, a ProcessPoolExecutor of process_workers is created on first use.
+        The callbacks must be picklable, which module level functions are."""
+        if self._process_executor is None:
+            with self._subscription_lock:
+                if self._process_executor is None:
+                    self._process_executor = ProcessPoolExecutor(
+                        max_workers=self.process_workers
+                    )
+        return self._process_executor
+
+    def shutdown(self, wait: bool = True):
+        """Shut down the executors created by the event manager."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+        if self._owns_process_executor and self._process_executor is not None:
+            self._process_executor.shutdown(wait=wait)
+            self._process_executor = None
+
+    def _submit_process_batches(
+        self, calls: Dict[Any, List[Tuple[int, int, E]]]
+    ) -> Dict[int, Dict[int, _ProcessResult]]:
+        """Submit the process callbacks of a batch, sending up to process_batch_size events of a callback per call.
+        calls maps the weak reference of each callback to its (event index, position, event) items,
+        the results are returned by event index and position."""
+        pending: Dict[int, Dict[int, _ProcessResult]] = defaultdict(dict)
+        submit = self.process_executor.submit if calls else None
+        size = max(1, self.process_batch_size)
+        for func_ref, items in calls.items():
+            func = func_ref()
+            for start in range(0, len(items), size):
+                chunk = items[start : start + size]
+                future = submit(_call_in_process, func, [item[2] for item in chunk])
+                for index, (event_index, position, _) in enumerate(chunk):
+                    pending[event_index][position] = _ProcessResult(future, index)
+        return pending
+
+    def _call_in_worker(self, processing: CallbackProcessing):
+        # callbacks emitting events from a worker dispatch them inline, waiting on the pool from the pool may deadlock
+        self._local.in_worker = True
+        try:
+            return processing.call()
+        finally:
+            self._local.in_worker = False
+
+    def _dispatch_processings(self, processings: List[CallbackProcessing]) -> List:
+        """Call the processings of an emitted event, offloading the parallel and process ones."""
+        if self.halted:
+            self._check_callqueue_room(processings)
+            return super()._dispatch_processings(processings)
+        threaded = (
+            len(processings) > 1
+            and not getattr(self._local, "in_worker", False)
+            and (self.parallel or any(p.callback.parallel for p in processings))
+        )
+        if not threaded and not any(p.callback.process for p in processings):
+            self._check_callqueue_room(processings)
+            return super()._dispatch_processings(processings)
+        futures = []
+        for position, processing in enumerate(processings):
+            if processing.process:
+                future = self.process_executor.submit(
+                    _call_in_process, processing.func, [processing.event]
+                )
+                futures.append(_ProcessResult(future, 0))
+            elif threaded and (self.parallel or processing.parallel):
+                futures.append(self.executor.submit(self._call_in_worker, processing))
+            else:
+                futures.append(None)
+        # the emitting thread runs the remaining callbacks while the pools run the offloaded ones
+        inline_results = {}
+        for position, (processing, future) in enumerate(zip(processings, futures)):
+            if future is None:
                 try:
-                    results.append(callback.call())
+                    inline_results[position] = processing.call()
                 except Exception as e:
                     moduvent_logger.exception(f"Error while processing callback: {e}")
-                    continue
-        moduvent_logger.debug("End processing callqueue.")
+        results = []
+        for position, future in enumerate(futures):
+            if future is None:
+                if position in inline_results:
+                    results.append(inline_results[position])
+                continue
+            results.append(_future_result(future, processings[position]))
+        return results + self._process_callqueue()
+
+    def emit_many(self, events: Iterable[E]) -> List[List]:
+        """Emit a batch of events and return the results of each event in input order.
+        Event types are checked and resolved once per batch."""
+        return self._emit_batch(events, coalesce=True)
+
+    def _hold_event(self, event: E, rule: CoalesceRule):
+        with self._subscription_lock:
+            return super()._hold_event(event, rule)
+
+    def _take_pending_events(self, now: float | None = None) -> List[E]:
+        with self._subscription_lock:
+            return super()._take_pending_events(now)
+
+    def flush(self) -> List[List]:
+        """Release every event held by coalescing and return the results of each of them."""
+        return self._emit_batch(self._take_pending_events(), coalesce=False)
+
+    def pump(self) -> List[List]:
+        """Release the events held by coalescing whose window has elapsed and the events held by
+        trailing throttles whose interval has elapsed, call it periodically."""
+        results = []
+        if self._pending_events:
+            results = self._emit_batch(
+                self._take_pending_events(monotonic()), coalesce=False
+            )
+        if self._deferred_callbacks:
+            for processing in self._take_deferred_processings():
+                results.append(self._dispatch_processings([processing]))
+        return results
+
+    def _on_deferred(self, callback: CallbackRegistry):
+        with self._subscription_lock:
+            self._deferred_callbacks[id(callback)] = callback
+
+    def _take_deferred_processings(self) -> List[CallbackProcessing]:
+        processings = []
+        with self._subscription_lock:
+            for key, callback in list(self._deferred_callbacks.items()):
+                processing = self._release_deferred(callback)
+                if processing is not None:
+                    processings.append(processing)
+                if callback.limiter.pending is None:
+                    del self._deferred_callbacks[key]
+        return processings
+
+    def _emit_batch(self, events: Iterable[E], coalesce: bool) -> List[List]:
+        """Prepare and dispatch the events one after the other, as emit would.
+        The process callbacks are held back and sent process_batch_size events per call once
+        every event is dispatched, their results are put back in place at the end."""
+        results = []
+        # per event: its processings held back for the process pool by position, and the number of the others
+        held: List[Tuple[Dict[int, CallbackProcessing], int]] = []
+        calls: Dict[Any, List[Tuple[int, int, E]]] = defaultdict(list)
+        for event_index, processings in enumerate(
+            self._prepare_batch(events, coalesce)
+        ):
+            event_held = {}
+            if not self.halted and any(p.callback.process for p in processings):
+                for position, processing in enumerate(processings):
+                    if processing.callback.process:
+                        event_held[position] = processing
+                        calls[processing.callback._func_ref].append(
+                            (event_index, position, processing.event)
+                        )
+                processings = [p for p in processings if not p.callback.process]
+            held.append((event_held, len(processings)))
+            results.append(
+                [] if self.halted else self._dispatch_processings(processings)
+            )
+        if not calls:
+            return results
+        pending = self._submit_process_batches(calls)
+        for event_index, (event_held, local_count) in enumerate(held):
+            if not event_held:
+                continue
+            local = iter(results[event_index])
+            merged = []
+            for position in range(len(event_held) + local_count):
+                if position in event_held:
+                    merged.append(
+                        _future_result(
+                            pending[event_index][position], event_held[position]
+                        )
+                    )
+                else:
+                    merged.append(next(local, None))
+            # the results of nested emits follow, as with emit
+            merged.extend(local)
+            results[event_index] = merged
         return results
 
     def register(
@@ -96,9 +479,29 @@ class EventManager(BaseEventManager[CallbackRegistry, CallbackProcessing, E]):
         func: Callable[[E], Any],
         event_type: Type[E],
         *conditions: Callable[[E], bool],
-    ):
+        parallel: bool = False,
+        process: bool = False,
+        priority: int = 0,
+        where: Dict[str, Any] | None = None,
+        rate_limit: float | None = None,
+        burst: int = 1,
+        throttle: float | None = None,
+        trailing: bool = False,
+    ) -> Subscription[CallbackRegistry]:
         with self._subscription_lock:
-            super().register(func, event_type, *conditions)
+            return super().register(
+                func,
+                event_type,
+                *conditions,
+                parallel=parallel,
+                process=process,
+                priority=priority,
+                where=where,
+                rate_limit=rate_limit,
+                burst=burst,
+                throttle=throttle,
+                trailing=trailing,
+            )
 
     def subscribe(self, *args, **kwargs):
         """subscribe dispatcher decorator.
@@ -106,13 +509,14 @@ class EventManager(BaseEventManager[CallbackRegistry, CallbackProcessing, E]):
         If the second argument is a function, then functions after that will be registered as conditions.
         If the second argument is another event, then events after that will be registered as multi-callbacks.
         If arguments after the second argument is not same, then it will raise a ValueError.
+        Keyword arguments are passed to register().
         """
         strategy = get_subscription_strategy(*args, **kwargs)
         if strategy == SUBSCRIPTION_STRATEGY.EVENTS:
 
             def events_decorator(func: Callable[[E], Any]):
                 for event_type in args:
-                    self.register(func=func, event_type=event_type)
+                    self.register(func=func, event_type=event_type, **kwargs)
                 return func
 
             return events_decorator
@@ -121,7 +525,7 @@ class EventManager(BaseEventManager[CallbackRegistry, CallbackProcessing, E]):
             conditions = args[1:]
 
             def conditions_decorator(func: Callable[[E], Any]):
-                self.register(func, event_type, *conditions)
+                self.register(func, event_type, *conditions, **kwargs)
                 return func
 
             return conditions_decorator
@@ -149,4 +553,5 @@ class EventAwareBase(Generic[E], metaclass=EventMeta):
                     getattr(self, callback.func.__name__),
                     event_type,
                     *callback.conditions,
+                    **callback.options,
                 )
@@ -1,4 +1,16 @@
+import inspect
+import weakref
 from enum import Enum, auto
+from functools import partial
+from types import (
+    BuiltinFunctionType,
+    ClassMethodDescriptorType,
+    FunctionType,
+    MethodDescriptorType,
+    MethodType,
+    MethodWrapperType,
+    WrapperDescriptorType,
+)
 
 from .events import Event
 
@@ -16,6 +28,9 @@ class FunctionTypes(Enum):
     BOUND_METHOD: instance is the instance (BOUND_METHOD) or class (CLASSMETHOD)
     UNBOUND_METHOD: instance isn't set yet since the class hasn't been initialized
     FUNCTION/STATICMETHOD: instance is None
+    BUILTIN: function or method implemented in C (len, list.append, str.upper, ...)
+    PARTIAL: functools.partial object
+    CALLABLE_OBJECT: any other callable, e.g. an instance with __call__, a class or a Cython function
     """
 
     STATICMETHOD = auto()
@@ -23,23 +38,72 @@ class FunctionTypes(Enum):
     UNBOUND_METHOD = auto()  # this occurs when a class method (both classmethod and instance method) is defined but the class is not initialized
     FUNCTION = auto()
     CALLBACK = auto()
+    BUILTIN = auto()
+    PARTIAL = auto()
+    CALLABLE_OBJECT = auto()
     UNKNOWN = auto()
 
 
-def check_function_type(func):
-    type_name = func.__class__.__name__
-    match type_name:
-        case "staticmethod":
-            return FunctionTypes.STATICMETHOD
-        case "method":
-            return FunctionTypes.BOUND_METHOD
-        case "function":
-            if hasattr(func, "_subscriptions"):
-                return FunctionTypes.UNBOUND_METHOD
-            else:
-                return FunctionTypes.FUNCTION
-        case _:
-            return FunctionTypes.UNKNOWN
+# the kinds that only depend on the type of the callable, filled by check_function_type on first sight of a type
+# weakly keyed, so that the classes of callable objects created at runtime can still be collected
+_FUNCTION_TYPES: weakref.WeakKeyDictionary[type, FunctionTypes] = (
+    weakref.WeakKeyDictionary(
+        {
+            staticmethod: FunctionTypes.STATICMETHOD,
+            MethodType: FunctionTypes.BOUND_METHOD,
+            BuiltinFunctionType: FunctionTypes.BUILTIN,
+            MethodDescriptorType: FunctionTypes.BUILTIN,
+            WrapperDescriptorType: FunctionTypes.BUILTIN,
+            MethodWrapperType: FunctionTypes.BUILTIN,
+            ClassMethodDescriptorType: FunctionTypes.BUILTIN,
+            partial: FunctionTypes.PARTIAL,
+            type(None): FunctionTypes.UNKNOWN,
+        }
+    )
+)
+
+
+def check_function_type(func) -> FunctionTypes:
+    func_class = type(func)
+    if func_class is FunctionType:
+        # subscribe_method() marks the functions of a class body until the class is instantiated
+        if "_subscriptions" in func.__dict__:
+            return FunctionTypes.UNBOUND_METHOD
+        return FunctionTypes.FUNCTION
+    try:
+        return _FUNCTION_TYPES[func_class]
+    except KeyError:
+        pass
+    if isinstance(func, partial):
+        function_type = FunctionTypes.PARTIAL
+    elif callable(func):
+        function_type = FunctionTypes.CALLABLE_OBJECT
+    else:
+        function_type = FunctionTypes.UNKNOWN
+    # whether an object is callable only depends on its type
+    _FUNCTION_TYPES[func_class] = function_type
+    return function_type
+
+
+def is_coroutine_callable(func) -> bool:
+    """Whether calling func returns a coroutine, including callable objects with an async __call__."""
+    return inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(
+        getattr(func, "__call__", None)
+    )
+
+
+def get_function_key(func) -> int | tuple[int, int | str]:
+    """Return a hashable key identifying func without keeping it alive.
+    Bound methods are created on every attribute access, so they are identified by their instance and function
+    (by their instance and name for builtin methods, which have no function)."""
+    function_type = check_function_type(func)
+    if function_type == FunctionTypes.BOUND_METHOD:
+        return id(func.__self__), id(func.__func__)
+    if function_type == FunctionTypes.BUILTIN:
+        instance = getattr(func, "__self__", None)
+        if instance is not None:
+            return id(instance), func.__name__
+    return id(func)
 
 
 class SUBSCRIPTION_STRATEGY(Enum):
@@ -47,6 +111,20 @@ class SUBSCRIPTION_STRATEGY(Enum):
     CONDITIONS = auto()
 
 
+class OVERFLOW_POLICY(Enum):
+    """What a manager does with a callback when its bounded callqueue is full.
+    BLOCK: wait for room (the sync manager makes room by processing the callqueue in the emitting thread)
+    DROP_NEWEST: drop the new callback
+    DROP_OLDEST: drop the oldest queued callback
+    RAISE: raise queue.Full (asyncio.QueueFull for the async manager)
+    """
+
+    BLOCK = "block"
+    DROP_NEWEST = "drop_newest"
+    DROP_OLDEST = "drop_oldest"
+    RAISE = "raise"
+
+
 def get_subscription_strategy(*args, **kwargs):
     """
     The first argument must be an event type.
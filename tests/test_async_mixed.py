@@ -0,0 +1,93 @@
+import threading
+
+import pytest
+
+from moduvent import AsyncEventManager, Event
+
+
+class Job(Event):
+    def __init__(self, value=0):
+        self.value = value
+
+
+def sync_double(event):
+    return event.value * 2
+
+
+async def async_triple(event):
+    return event.value * 3
+
+
+def thread_id(event):
+    return threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_sync_handlers_run_inline_without_the_pool():
+    mgr = AsyncEventManager()
+    subscription = await mgr.register(sync_double, Job)
+    assert not subscription.registry.coroutine
+    assert await mgr.emit(Job(2)) == [4]
+    assert not mgr._workers
+
+
+@pytest.mark.asyncio
+async def test_mixed_handlers_keep_registration_order():
+    mgr = AsyncEventManager()
+    await mgr.register(async_triple, Job)
+    await mgr.register(sync_double, Job)
+    await mgr.register(thread_id, Job, blocking=True)
+    tripled, doubled, ident = await mgr.emit(Job(1))
+    assert (tripled, doubled) == (3, 2)
+    assert ident != threading.get_ident()
+    await mgr.stop()
+
+
+@pytest.mark.asyncio
+async def test_sync_handlers_do_not_overtake_higher_priorities():
+    mgr = AsyncEventManager()
+    calls = []
+
+    async def hi(event):
+        calls.append("hi")
+
+    def sync(event):
+        calls.append("sync")
+
+    async def slow(event):
+        calls.append("slow")
+
+    await mgr.register(hi, Job, priority=10)
+    await mgr.register(sync, Job)
+    await mgr.register(slow, Job)
+    await mgr.emit(Job())
+    assert calls == ["hi", "sync", "slow"]
+    calls.clear()
+    await mgr.emit(Job(), wait=False)
+    await mgr.stop()
+    assert calls == ["hi", "sync", "slow"]
+
+
+@pytest.mark.asyncio
+async def test_plain_function_returning_an_awaitable():
+    mgr = AsyncEventManager()
+
+    def deferred(event):
+        return async_triple(event)
+
+    await mgr.register(deferred, Job)
+    assert await mgr.emit(Job(2)) == [6]
+
+
+@pytest.mark.asyncio
+async def test_subscribe_options_and_conditions_reach_register():
+    mgr = AsyncEventManager()
+
+    @mgr.subscribe(Job, lambda event: event.value > 0, blocking=True)
+    def positive(event):
+        return threading.get_ident()
+
+    await mgr.initialize()
+    assert await mgr.emit(Job(0)) == []
+    assert await mgr.emit(Job(1)) != [threading.get_ident()]
+    await mgr.stop()
@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+from moduvent import AsyncEventManager, Event
+
+
+class Job(Event):
+    def __init__(self, value=0):
+        self.value = value
+
+
+class Outer(Event): ...
+
+
+@pytest.mark.asyncio
+async def test_pool_runs_worker_count_workers():
+    mgr = AsyncEventManager(worker_count=3)
+    running = 0
+    peak = 0
+
+    async def on_job(event):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return event.value
+
+    for _ in range(6):
+        await mgr.register(on_job, Job)
+    assert await mgr.emit(Job(1)) == [1] * 6
+    assert len(mgr._workers) == 3
+    assert peak == 3
+    await mgr.stop()
+    assert not mgr.running
+
+
+@pytest.mark.asyncio
+async def test_concurrent_emits_receive_their_own_results():
+    mgr = AsyncEventManager(worker_count=2)
+
+    async def on_job(event):
+        await asyncio.sleep(0.001 * (event.value % 3))
+        return event.value
+
+    await mgr.register(on_job, Job)
+    results = await asyncio.gather(*(mgr.emit(Job(i)) for i in range(20)))
+    assert results == [[i] for i in range(20)]
+    await mgr.stop()
+
+
+@pytest.mark.asyncio
+async def test_fire_and_forget_emit():
+    mgr = AsyncEventManager()
+    seen = []
+
+    async def on_job(event):
+        seen.append(event.value)
+
+    await mgr.register(on_job, Job)
+    assert await mgr.emit(Job(1), wait=False) == []
+    assert await mgr.emit_many([Job(2), Job(3)], wait=False) == [[], []]
+    await mgr.stop(drain=True)
+    assert seen == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_nested_emit_in_single_worker_does_not_deadlock():
+    mgr = AsyncEventManager(worker_count=1)
+
+    async def on_job(event):
+        return event.value
+
+    async def on_outer(event):
+        return await mgr.emit(Job(5))
+
+    await mgr.register(on_job, Job)
+    await mgr.register(on_outer, Outer)
+    assert await asyncio.wait_for(mgr.emit(Outer()), 1) == [[5]]
+    await mgr.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_without_drain_drops_queued_callbacks():
+    mgr = AsyncEventManager(worker_count=1)
+    release = asyncio.Event()
+
+    async def on_job(event):
+        await release.wait()
+        return event.value
+
+    await mgr.register(on_job, Job)
+    await mgr.start()
+    pending = asyncio.gather(mgr.emit(Job(1)), mgr.emit(Job(2)))
+    await asyncio.sleep(0)
+    await mgr.stop(drain=False)
+    assert await pending == [[None], [None]]
+
+
+@pytest.mark.asyncio
+async def test_eager_mode_completes_non_suspending_handlers_in_place():
+    mgr = AsyncEventManager(eager=True)
+    resumed = []
+
+    async def immediate(event):
+        return event.value
+
+    async def suspending(event):
+        await asyncio.sleep(0)
+        resumed.append(event.value)
+        return -event.value
+
+    await mgr.register(immediate, Job)
+    await mgr.register(suspending, Job)
+    assert await mgr.emit(Job(2)) == [2, -2]
+    assert not mgr._workers
+    assert await mgr.emit(Job(3), wait=False) == []
+    assert resumed == [2]
+    await asyncio.sleep(0.01)
+    assert resumed == [2, 3]
+    assert not mgr._background_tasks
@@ -0,0 +1,156 @@
+import asyncio
+from queue import Full
+
+import pytest
+
+from moduvent import AsyncEventManager, Event, EventManager
+
+
+class Job(Event):
+    def __init__(self, value=0):
+        self.value = value
+
+
+class Other(Event): ...
+
+
+def make_sync_manager(overflow):
+    mgr = EventManager(maxsize=2, overflow=overflow)
+    handlers = []
+    for index in range(5):
+
+        def handler(event, index=index):
+            return index
+
+        handlers.append(handler)  # callbacks are weakly referenced
+        mgr.register(handler, Job)
+    return mgr, handlers
+
+
+def test_sync_block_processes_the_callqueue_to_make_room():
+    mgr, _ = make_sync_manager("block")
+    assert mgr.emit(Job()) == [0, 1, 2, 3, 4]
+    assert mgr.blocked_events == 2
+    assert mgr.dropped_events == 0
+
+
+def test_sync_drop_newest():
+    mgr, _ = make_sync_manager("drop_newest")
+    assert mgr.emit(Job()) == [0, 1]
+    assert mgr.dropped_events == 3
+
+
+def test_sync_drop_oldest():
+    mgr, _ = make_sync_manager("drop_oldest")
+    assert mgr.emit(Job()) == [3, 4]
+    assert mgr.dropped_events == 3
+
+
+def test_sync_raise():
+    mgr, _ = make_sync_manager("raise")
+    with pytest.raises(Full):
+        mgr.emit(Job())
+    # the failed emit queued nothing, the manager keeps working
+    assert mgr._get_callqueue_length() == 0
+
+    def on_other(event):
+        return "other"
+
+    mgr.register(on_other, Other)
+    assert mgr.emit(Other()) == ["other"]
+
+
+def test_invalid_overflow_policy():
+    with pytest.raises(ValueError):
+        EventManager(overflow="spill")
+
+
+async def make_async_manager(overflow):
+    mgr = AsyncEventManager(worker_count=1, maxsize=2, overflow=overflow)
+    release = asyncio.Event()
+    seen = []
+
+    async def on_job(event):
+        await release.wait()
+        seen.append(event.value)
+
+    await mgr.register(on_job, Job)
+    await mgr.start()
+    return mgr, release, seen, on_job
+
+
+@pytest.mark.asyncio
+async def test_async_drop_newest():
+    mgr, release, seen, _ = await make_async_manager("drop_newest")
+    for value in range(5):
+        await mgr.emit(Job(value), wait=False)
+    release.set()
+    await mgr.stop()
+    assert seen == [0, 1]
+    assert mgr.dropped_events == 3
+
+
+@pytest.mark.asyncio
+async def test_async_drop_oldest_resolves_dropped_results():
+    mgr, release, seen, _ = await make_async_manager("drop_oldest")
+    waiting = asyncio.ensure_future(mgr.emit(Job(0)))
+    await asyncio.sleep(0)
+    for value in range(1, 5):
+        await mgr.emit(Job(value), wait=False)
+    release.set()
+    assert await waiting == [None]
+    await mgr.stop()
+    assert seen == [3, 4]
+    assert mgr.dropped_events == 3
+
+
+@pytest.mark.asyncio
+async def test_async_block_waits_for_room():
+    mgr, release, seen, _ = await make_async_manager("block")
+    emits = asyncio.gather(*(mgr.emit(Job(value), wait=False) for value in range(5)))
+    await asyncio.sleep(0)
+    release.set()
+    await emits
+    await mgr.stop()
+    assert sorted(seen) == [0, 1, 2, 3, 4]
+    assert mgr.blocked_events >= 1
+    assert mgr.dropped_events == 0
+
+
+@pytest.mark.asyncio
+async def test_async_raise():
+    mgr, release, _, _ = await make_async_manager("raise")
+    await mgr.emit(Job(0), wait=False)
+    await mgr.emit(Job(1), wait=False)
+    with pytest.raises(asyncio.QueueFull):
+        await mgr.emit(Job(2), wait=False)
+    release.set()
+    await mgr.stop()
+
+
+@pytest.mark.asyncio
+async def test_async_raise_leaves_nothing_behind():
+    mgr = AsyncEventManager(worker_count=1, maxsize=1, overflow="raise")
+    calls = []
+
+    def first(event):
+        calls.append("first")
+
+    async def second(event):
+        calls.append("second")
+
+    async def third(event):
+        calls.append("third")
+
+    async def fourth(event):
+        calls.append("fourth")
+
+    await mgr.register(first, Job, priority=1)
+    for handler in (second, third, fourth):
+        await mgr.register(handler, Job)
+    with pytest.raises(asyncio.QueueFull):
+        await mgr.emit(Job())
+    assert mgr._callqueue.qsize() == 0
+    await mgr.start()
+    await mgr.stop()
+    assert calls == []
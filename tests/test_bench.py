@@ -0,0 +1,53 @@
+import json
+import sys
+
+from moduvent import bench, event_manager
+
+
+def fake_benchmark():
+    return {"emit_us": 2.0, "emits_per_s": 100.0}
+
+
+def test_compare_flags_regressions_in_both_directions():
+    baseline = {"fake": {"emit_us": 1.0, "emits_per_s": 200.0, "gone": 1.0}}
+    lines = bench.compare({"fake": fake_benchmark()}, baseline, tolerance=0.1)
+    assert len(lines) == 2
+    assert all(line.endswith("REGRESSION") for line in lines)
+    assert bench.compare({"fake": fake_benchmark()}, {"fake": fake_benchmark()}) == [
+        "fake.emit_us: 2.000 -> 2.000 (+0.0%)",
+        "fake.emits_per_s: 100.000 -> 100.000 (+0.0%)",
+    ]
+
+
+def test_main_writes_json_and_compares_with_a_baseline(tmp_path, monkeypatch):
+    monkeypatch.setitem(bench.BENCHMARKS, "fake", fake_benchmark)
+    monkeypatch.setattr(bench.logger, "remove", lambda *args: None)
+    output = tmp_path / "results.json"
+    assert bench.main(["fake", "--json", str(output)]) == 0
+    written = json.loads(output.read_text())
+    assert written["results"] == {"fake": fake_benchmark()}
+    assert "python" in written["metadata"]
+
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"results": {"fake": {"emit_us": 1.0}}}))
+    assert bench.main(["fake", "--baseline", str(baseline)]) == 1
+    assert bench.main(["fake", "--baseline", str(output)]) == 0
+
+
+def test_discover_modules_benchmark_cleans_up():
+    path = list(sys.path)
+    results = bench.bench_discover_modules(plugins=2, repeat=1)
+    assert results["discover_ms[plugins=4]"] > 0
+    assert sys.path == path
+    assert not any(name.startswith("bench_plugin_") for name in sys.modules)
+    assert not any(
+        event_type.__name__.startswith("bench_plugin_") and callbacks
+        for event_type, callbacks in event_manager._subscriptions.items()
+    )
+
+
+def test_dispatch_allocations_count_blocks():
+    results = bench.bench_dispatch_allocations(handlers=4)
+    # at least one processing per callback is alive while the last one runs
+    assert results["alloc_blocks_per_callback"] >= 1
+    assert results["alloc_bytes_per_emit"] > 0
@@ -56,8 +56,8 @@ def test_subscribing_to_signals(capsys):
     ]
 
     # test_subscribing_to_specific_senders
-    # moduvent does not encorage you to subscribe to specific senders.
-    # This is because complex conditions are hard to represent, error-prone and will slow down the system.
+    # conditions are called on every emit, for many subscribers on one event type prefer
+    # register(b_subscriber, ready, where={"sender": processor_b}) which is looked up in a hash table.
     def b_subscriber(signal: Signal):
         print("Caught signal from processor_b.")
 
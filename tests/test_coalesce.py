@@ -0,0 +1,99 @@
+import asyncio
+import time
+
+import pytest
+
+from moduvent import AsyncEventManager, DataEvent, EventManager
+
+
+def by_key(event):
+    return event.data[0]
+
+
+def latest(event):
+    return event.data
+
+
+def test_coalesce_until_flush():
+    mgr = EventManager()
+    mgr.register(latest, DataEvent)
+    mgr.coalesce(DataEvent, key=by_key)
+    for value in range(50):
+        assert mgr.emit(DataEvent(("a", value))) == []
+        assert mgr.emit(DataEvent(("b", value))) == []
+    assert mgr.coalesced_events == 98
+    assert mgr.pump() == []
+    assert mgr.flush() == [[("a", 49)], [("b", 49)]]
+    assert mgr.flush() == []
+
+
+def test_emit_many_is_coalesced_and_uncoalesce_stops_it():
+    mgr = EventManager()
+    mgr.register(latest, DataEvent)
+    mgr.coalesce(DataEvent)
+    assert mgr.emit_many([DataEvent(1), DataEvent(2)]) == [[], []]
+    mgr.uncoalesce(DataEvent)
+    assert mgr.emit(DataEvent(3)) == [3]
+    assert mgr.flush() == [[2]]
+
+
+def test_window_is_released_by_pump():
+    mgr = EventManager()
+    mgr.register(latest, DataEvent)
+    mgr.coalesce(DataEvent, window=0.02)
+    mgr.emit(DataEvent(1))
+    mgr.emit(DataEvent(2))
+    assert mgr.pump() == []
+    time.sleep(0.03)
+    assert mgr.pump() == [[2]]
+
+
+def test_debounce_extends_the_window():
+    mgr = EventManager()
+    mgr.register(latest, DataEvent)
+    mgr.coalesce(DataEvent, window=0.05, debounce=True)
+    mgr.emit(DataEvent(1))
+    time.sleep(0.03)
+    mgr.emit(DataEvent(2))
+    time.sleep(0.03)
+    assert mgr.pump() == []
+    time.sleep(0.03)
+    assert mgr.pump() == [[2]]
+
+
+def test_coalesce_validation():
+    mgr = EventManager()
+    with pytest.raises(ValueError):
+        mgr.coalesce(int)
+    with pytest.raises(ValueError):
+        mgr.coalesce(DataEvent, window=-1)
+
+
+@pytest.mark.asyncio
+async def test_async_window_releases_on_a_timer():
+    mgr = AsyncEventManager()
+    seen = []
+
+    async def record(event):
+        seen.append(event.data)
+
+    await mgr.register(record, DataEvent)
+    mgr.coalesce(DataEvent, key=by_key, window=0.01)
+    for value in range(20):
+        assert await mgr.emit(DataEvent(("a", value))) == []
+    await asyncio.sleep(0.05)
+    assert seen == [("a", 19)]
+    assert mgr.coalesced_events == 19
+    await mgr.stop()
+
+
+@pytest.mark.asyncio
+async def test_async_flush():
+    mgr = AsyncEventManager()
+    await mgr.register(latest, DataEvent)
+    mgr.coalesce(DataEvent, window=10)
+    await mgr.emit(DataEvent(1))
+    await mgr.emit(DataEvent(2))
+    assert await mgr.flush() == [[2]]
+    await asyncio.sleep(0)
+    assert mgr._pending_events == {}
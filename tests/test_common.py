@@ -98,18 +98,9 @@ def test_unsubscribe_process_logic(
     # Arrange
 
     mgr = EventManager()
-
-    # Patch _remove_subscriptions to actually remove
-    def _remove_subscriptions(filter_func):
-        new_subs = {}
-        for event_type_, callbacks in subscriptions.items():
-            for cb in callbacks:
-                if not filter_func(event_type_, cb):
-                    new_subs.setdefault(event_type_, []).append(cb)
-        mgr._subscriptions = new_subs
-
-    mgr._subscriptions = dict(subscriptions)
-    mgr._remove_subscriptions = _remove_subscriptions
+    for event_type_, callbacks in subscriptions.items():
+        for cb in callbacks:
+            mgr.register(cb, event_type_)
 
     # Act
 
@@ -332,3 +323,200 @@ def test_remove_subscriptions_filters_correctly():
     # Assert
 
     assert mgr._subscriptions == {DummyEvent: [cb2]}
+
+
+def test_dispatch_plan_is_compiled_once_and_reused():
+    # Arrange
+
+    mgr = EventManager()
+    mgr.register(func_1, DummyEvent)
+
+    # Act
+
+    mgr.emit(DummyEvent())
+    plan = mgr._dispatch_plans[DummyEvent]
+    mgr.emit(DummyEvent())
+
+    # Assert
+
+    assert mgr._dispatch_plans[DummyEvent] is plan
+    assert [entry[3] for entry in plan] == [func_1]
+
+
+def test_dispatch_plan_invalidated_on_subscription_changes():
+    # Arrange
+
+    mgr = EventManager()
+    called = []
+
+    def cb(event):
+        called.append("cb")
+
+    mgr.register(func_1, DummyEvent)
+    mgr.emit(DummyEvent())
+
+    # Act & Assert
+
+    mgr.register(cb, DummyEvent)
+    assert DummyEvent not in mgr._dispatch_plans
+    mgr.emit(DummyEvent())
+    assert called == ["cb"]
+
+    mgr.unsubscribe(cb, DummyEvent)
+    assert DummyEvent not in mgr._dispatch_plans
+    mgr.emit(DummyEvent())
+    assert called == ["cb"]
+
+    mgr.reset()
+    assert mgr._dispatch_plans == {}
+
+
+class ChildEvent(DummyEvent): ...
+
+
+def test_hierarchical_dispatch_reaches_subclasses_in_registration_order():
+    # Arrange
+
+    mgr = EventManager(hierarchical=True)
+    called = []
+
+    def on_base(event):
+        called.append("base")
+
+    def on_child(event):
+        called.append("child")
+
+    def on_event(event):
+        called.append("event")
+
+    mgr.register(on_base, DummyEvent)
+    mgr.register(on_child, ChildEvent)
+    mgr.register(on_event, Event)
+
+    # Act
+
+    mgr.emit(ChildEvent())
+    mgr.emit(DummyEvent_2())
+
+    # Assert
+
+    assert called == ["base", "child", "event", "event"]
+
+
+def test_hierarchical_dispatch_is_opt_in():
+    # Arrange
+
+    mgr = EventManager()
+    called = []
+
+    def on_base(event):
+        called.append(event)
+
+    mgr.register(on_base, DummyEvent)
+
+    # Act & Assert
+
+    mgr.emit(ChildEvent())
+    assert called == []
+
+    mgr.hierarchical = True
+    mgr.emit(ChildEvent())
+    assert len(called) == 1
+
+
+def test_hierarchical_plan_invalidated_for_subclasses():
+    # Arrange
+
+    mgr = EventManager(hierarchical=True)
+    called = []
+
+    def on_base(event):
+        called.append(event)
+
+    mgr.emit(ChildEvent())
+    assert ChildEvent in mgr._dispatch_plans
+
+    # Act
+
+    mgr.register(on_base, DummyEvent)
+
+    # Assert
+
+    assert ChildEvent not in mgr._dispatch_plans
+    mgr.emit(ChildEvent())
+    assert len(called) == 1
+
+
+def test_resolved_processing_shares_the_registry():
+    # Arrange
+
+    mgr = EventManager()
+    subscription = mgr.register(func_1, DummyEvent)
+    event = DummyEvent()
+
+    # Act
+
+    processing = CallbackProcessing._resolved(subscription.registry, event)
+
+    # Assert
+
+    assert not hasattr(processing, "__dict__")
+    assert processing.callback is subscription.registry
+    assert processing.event is event
+    assert processing.func is func_1
+
+
+def test_processing_built_by_hand_checks_its_conditions():
+    # Arrange
+
+    called = []
+
+    def on_event(event):
+        called.append(event)
+        return "called"
+
+    # Act
+
+    rejected = CallbackProcessing(on_event, DummyEvent(), [lambda e: False])
+    accepted = CallbackProcessing(on_event, DummyEvent(), [lambda e: True])
+
+    # Assert
+
+    assert rejected.call() is None
+    assert accepted.call() == "called"
+    assert len(called) == 1
+    with pytest.raises(TypeError):
+        CallbackProcessing(on_event, DummyEvent)
+
+
+def test_registry_is_a_slotted_record():
+    # Arrange
+
+    mgr = EventManager()
+
+    # Act
+
+    registry = mgr.register(func_1, DummyEvent, priority=3).registry
+
+    # Assert
+
+    assert not hasattr(registry, "__dict__")
+    assert registry.func is func_1
+    assert registry.priority == 3
+    assert registry.where is None and registry.limiter is None
+
+
+@pytest.mark.parametrize(
+    "func,event_type,expected_error",
+    [
+        (None, DummyEvent, ValueError),  # nothing to reference
+        (func_1, DummyEvent(), TypeError),  # an event instead of an event type
+        (func_1, int, TypeError),  # not an event type
+    ],
+    ids=["func_none", "event_instance", "not_event_type"],
+)
+def test_registry_is_validated_on_creation(func, event_type, expected_error):
+    # Act & Assert
+
+    with pytest.raises(expected_error):
+        CallbackRegistry(func, event_type)
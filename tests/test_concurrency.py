@@ -0,0 +1,176 @@
+import threading
+
+from moduvent import Event, EventManager
+
+
+class Tick(Event): ...
+
+
+def test_emit_reads_snapshots_while_registrations_change():
+    mgr = EventManager()
+    counts = []
+    lock = threading.Lock()
+
+    def counter(event):
+        with lock:
+            counts.append(threading.get_ident())
+
+    def churn(event): ...
+
+    mgr.register(counter, Tick)
+    errors = []
+    done = threading.Event()
+
+    def producer():
+        try:
+            for _ in range(2000):
+                mgr.emit(Tick())
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    def registrar():
+        while not done.is_set():
+            mgr.register(churn, Tick).cancel()
+
+    producers = [threading.Thread(target=producer) for _ in range(4)]
+    churner = threading.Thread(target=registrar)
+    churner.start()
+    for thread in producers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    done.set()
+    churner.join()
+
+    assert not errors
+    assert len(counts) == 4 * 2000
+    assert mgr._subscriptions == {Tick: [counter]}
+
+
+def test_unsubscribe_holds_the_subscription_lock():
+    mgr = EventManager()
+
+    def handler(event): ...
+
+    mgr.register(handler, Tick)
+    looked_up = threading.Event()
+    registrations_of = mgr._registrations_of
+
+    def spy(func):
+        looked_up.set()
+        return registrations_of(func)
+
+    mgr._registrations_of = spy
+    with mgr._subscription_lock:
+        thread = threading.Thread(target=mgr.unsubscribe, args=(handler, Tick))
+        thread.start()
+        # the registrations are not even looked up while another thread changes them
+        assert not looked_up.wait(0.05)
+    thread.join()
+    assert looked_up.is_set()
+    assert mgr._subscriptions == {}
+
+
+def test_callqueues_are_per_thread():
+    mgr = EventManager()
+    mgr._callqueue.append("main")
+    seen = []
+
+    thread = threading.Thread(target=lambda: seen.append(len(mgr._callqueue)))
+    thread.start()
+    thread.join()
+
+    assert seen == [0]
+    assert mgr._get_callqueue_length() == 1
+
+
+def test_handler_registering_during_emit_does_not_change_current_dispatch():
+    mgr = EventManager()
+    called = []
+
+    def late(event):
+        called.append("late")
+
+    def first(event):
+        called.append("first")
+        mgr.register(late, Tick)
+
+    mgr.register(first, Tick)
+    mgr.emit(Tick())
+    assert called == ["first"]
+
+    mgr.emit(Tick())
+    assert called == ["first", "first", "late"]
+
+
+def test_parallel_manager_runs_callbacks_concurrently_in_order():
+    mgr = EventManager(parallel=True, max_workers=2)
+    barrier = threading.Barrier(2, timeout=5)
+
+    def first(event):
+        barrier.wait()
+        return "first"
+
+    def second(event):
+        barrier.wait()
+        return "second"
+
+    mgr.register(first, Tick)
+    mgr.register(second, Tick)
+    try:
+        assert mgr.emit(Tick()) == ["first", "second"]
+    finally:
+        mgr.shutdown()
+
+
+def test_parallel_subscriptions_run_beside_the_emitting_thread():
+    mgr = EventManager(max_workers=1)
+    barrier = threading.Barrier(2, timeout=5)
+    threads = {}
+
+    def pooled(event):
+        threads["pooled"] = threading.get_ident()
+        barrier.wait()
+        return "pooled"
+
+    def inline(event):
+        threads["inline"] = threading.get_ident()
+        barrier.wait()
+        return "inline"
+
+    mgr.register(pooled, Tick, parallel=True)
+    mgr.register(inline, Tick)
+    try:
+        assert mgr.emit(Tick()) == ["pooled", "inline"]
+    finally:
+        mgr.shutdown()
+
+    assert threads["inline"] == threading.get_ident()
+    assert threads["pooled"] != threading.get_ident()
+
+
+def test_parallel_callbacks_emitting_events_do_not_deadlock():
+    class Tock(Event): ...
+
+    mgr = EventManager(parallel=True, max_workers=1)
+
+    def tock_a(event):
+        return "a"
+
+    def tock_b(event):
+        return "b"
+
+    def tick_a(event):
+        return mgr.emit(Tock())
+
+    def tick_b(event):
+        return "tick_b"
+
+    mgr.register(tock_a, Tock)
+    mgr.register(tock_b, Tock)
+    mgr.register(tick_a, Tick)
+    mgr.register(tick_b, Tick)
+    try:
+        assert mgr.emit(Tick()) == [["a", "b"], "tick_b"]
+    finally:
+        mgr.shutdown()
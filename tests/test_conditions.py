@@ -0,0 +1,133 @@
+import pytest
+
+from moduvent import AsyncEventManager, DataEvent, EventManager
+
+
+def make_counter():
+    calls = []
+
+    def is_admin(event):
+        calls.append(event)
+        return event.data == "admin"
+
+    return is_admin, calls
+
+
+def first(event):
+    return "first"
+
+
+def second(event):
+    return "second"
+
+
+def third(event):
+    return "third"
+
+
+def test_shared_condition_is_evaluated_once_per_emit():
+    mgr = EventManager()
+    is_admin, calls = make_counter()
+    mgr.register(first, DataEvent, is_admin)
+    mgr.register(second, DataEvent, is_admin)
+    mgr.register(third, DataEvent, is_admin, where={"sender": None})
+    assert mgr.emit(DataEvent("admin")) == ["first", "second", "third"]
+    assert len(calls) == 1
+    assert mgr.emit(DataEvent("guest")) == []
+    assert len(calls) == 2
+    assert mgr._dispatch_plans[DataEvent].shared_conditions == {is_admin}
+
+
+def test_emit_many_memoizes_per_event():
+    mgr = EventManager()
+    is_admin, calls = make_counter()
+    mgr.register(first, DataEvent, is_admin)
+    mgr.register(second, DataEvent, is_admin)
+    assert mgr.emit_many([DataEvent("admin"), DataEvent("guest")]) == [
+        ["first", "second"],
+        [],
+    ]
+    assert len(calls) == 2
+
+
+def test_unshared_conditions_are_not_memoized():
+    mgr = EventManager()
+    is_admin, calls = make_counter()
+    mgr.register(first, DataEvent, is_admin)
+    assert mgr.emit(DataEvent("admin")) == ["first"]
+    assert len(calls) == 1
+    assert not mgr._dispatch_plans[DataEvent].shared_conditions
+
+
+class HasData:
+    """A condition that defines __eq__ without __hash__, so it is unhashable."""
+
+    def __eq__(self, other):
+        return isinstance(other, HasData)
+
+    def __call__(self, event):
+        return event.data is not None
+
+
+@pytest.mark.parametrize("adaptive", [False, True])
+def test_unhashable_conditions_next_to_shared_ones(adaptive):
+    mgr = EventManager(adaptive_conditions=adaptive)
+    is_admin, calls = make_counter()
+    mgr.register(first, DataEvent, is_admin)
+    mgr.register(second, DataEvent, HasData(), is_admin)
+    assert mgr.emit(DataEvent("admin")) == ["first", "second"]
+    assert mgr.emit(DataEvent(None)) == []
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_shared_condition_is_evaluated_once_per_emit():
+    mgr = AsyncEventManager()
+    is_admin, calls = make_counter()
+    await mgr.register(first, DataEvent, is_admin)
+    await mgr.register(second, DataEvent, is_admin)
+    assert await mgr.emit(DataEvent("admin")) == ["first", "second"]
+    assert len(calls) == 1
+
+
+def never_rejects(event):
+    return True
+
+
+def mostly_rejects(event):
+    return event.data % 10 == 0
+
+
+def test_adaptive_mode_runs_selective_conditions_first():
+    mgr = EventManager(adaptive_conditions=True, adapt_interval=10)
+    subscription = mgr.register(first, DataEvent, never_rejects, mostly_rejects)
+    assert subscription.condition_stats == ()
+    results = mgr.emit_many([DataEvent(value) for value in range(30)])
+    assert results == [["first"] if value % 10 == 0 else [] for value in range(30)]
+    stats = subscription.condition_stats
+    assert [s.condition for s in stats] == [mostly_rejects, never_rejects]
+    assert stats[0].evaluations == 30
+    assert stats[0].rejection_rate == pytest.approx(0.9)
+    assert stats[1].rejections == 0
+    assert stats[1].mean_time >= 0
+    # declaration order is kept for equality and unsubscribing
+    assert subscription.registry.conditions == (never_rejects, mostly_rejects)
+
+
+def test_adaptive_mode_only_times_a_sample_of_each_interval():
+    mgr = EventManager(adaptive_conditions=True, adapt_interval=10, adapt_sample=3)
+    subscription = mgr.register(first, DataEvent, never_rejects, mostly_rejects)
+    results = mgr.emit_many([DataEvent(value) for value in range(25)])
+    assert results == [["first"] if value % 10 == 0 else [] for value in range(25)]
+    # the first 3 checks of each of the intervals 0-9, 10-19 and 20-24,
+    # never_rejects runs behind mostly_rejects after the first interval
+    stats = subscription.condition_stats
+    assert [s.condition for s in stats] == [mostly_rejects, never_rejects]
+    assert [s.evaluations for s in stats] == [9, 3 + 1 + 1]
+
+
+def test_condition_stats_are_empty_without_adaptive_mode():
+    mgr = EventManager()
+    subscription = mgr.register(first, DataEvent, never_rejects)
+    mgr.emit(DataEvent(1))
+    assert subscription.condition_stats == ()
@@ -0,0 +1,108 @@
+import pytest
+
+from moduvent import AsyncEventManager, Event, EventManager
+
+
+class Ping(Event):
+    def __init__(self, value):
+        self.value = value
+
+
+class Pong(Event):
+    def __init__(self, value):
+        self.value = value
+
+
+class Muted(Event):
+    enabled = False
+
+
+def double(event):
+    return event.value * 2
+
+
+def negate(event):
+    return -event.value
+
+
+async def adouble(event):
+    return event.value * 2
+
+
+def test_emit_many_returns_results_in_input_order():
+    mgr = EventManager()
+    mgr.register(double, Ping)
+    mgr.register(negate, Pong)
+    mgr.register(double, Pong, lambda e: e.value > 1)
+
+    results = mgr.emit_many([Ping(1), Pong(1), Muted(), "not an event", Pong(2)])
+
+    assert results == [[2], [-1], [], [], [-2, 4]]
+
+
+def test_emit_many_resolves_each_type_once():
+    mgr = EventManager()
+    mgr.register(double, Ping)
+    resolved = []
+    compile_plan = mgr._compile_dispatch_plan
+
+    def counting_compile(event_type):
+        resolved.append(event_type)
+        return compile_plan(event_type)
+
+    mgr._compile_dispatch_plan = counting_compile
+
+    mgr.emit_many(Ping(i) for i in range(10))
+
+    assert resolved == [Ping]
+
+
+def test_emit_many_when_halted():
+    mgr = EventManager()
+    mgr.register(double, Ping)
+    mgr.halted = True
+
+    assert mgr.emit_many([Ping(1), Ping(2)]) == [[], []]
+
+
+@pytest.mark.asyncio
+async def test_async_emit_many_returns_results_in_input_order():
+    mgr = AsyncEventManager()
+    await mgr.register(adouble, Ping)
+
+    results = await mgr.emit_many([Ping(1), Pong(1), Ping(3)])
+
+    assert results == [[2], [], [6]]
+
+
+def make_switch():
+    """A handler that switches a flag off, and a handler whose condition reads the flag."""
+    state = {"on": True}
+
+    def switch_off(event):
+        state["on"] = False
+        return "off"
+
+    def handler(event):
+        return "h"
+
+    return state, switch_off, handler
+
+
+def test_emit_many_dispatches_each_event_before_preparing_the_next():
+    mgr = EventManager()
+    state, switch_off, handler = make_switch()
+    mgr.register(switch_off, Ping)
+    mgr.register(handler, Ping, lambda event: state["on"])
+
+    assert mgr.emit_many([Ping(1), Ping(2)]) == [["off", "h"], ["off"]]
+
+
+@pytest.mark.asyncio
+async def test_async_emit_many_dispatches_each_event_before_preparing_the_next():
+    mgr = AsyncEventManager()
+    state, switch_off, handler = make_switch()
+    await mgr.register(switch_off, Ping)
+    await mgr.register(handler, Ping, lambda event: state["on"])
+
+    assert await mgr.emit_many([Ping(1), Ping(2)]) == [["off", "h"], ["off"]]
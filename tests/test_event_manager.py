@@ -112,6 +112,7 @@ def test_process_callqueue(
     event_manager, callqueue, should_raise, expected_calls, expected_exceptions
 ):
     # Arrange
+    event_manager.trace = True
     event_manager._callqueue.clear()
     for cb in callqueue:
         event_manager._append_to_callqueue(cb)
@@ -124,6 +125,34 @@ def test_process_callqueue(
             assert mock_logger.exception.call_count == expected_exceptions
 
 
+def test_process_callqueue_without_trace_skips_logging(event_manager):
+    # Arrange
+    event_manager._append_to_callqueue(DummyCallbackProcessing("cb1"))
+    with patch("moduvent.moduvent.moduvent_logger") as mock_logger:
+        # Act
+        results = event_manager._process_callqueue()
+        # Assert
+        assert results == ["called cb1"]
+        assert mock_logger.debug.call_count == 0
+
+
+def test_emit_without_trace_does_not_format_events(event_manager):
+    # Arrange
+    class LoudEvent(Event):
+        def __str__(self):
+            raise AssertionError("formatted while tracing is off")
+
+    def handler(event):
+        return "handled"
+
+    event_manager.register(handler, LoudEvent, lambda e: False)
+    with patch("moduvent.common.common_logger") as mock_logger:
+        # Act
+        event_manager.emit(LoudEvent())
+        # Assert
+        assert mock_logger.debug.call_count == 0
+
+
 @pytest.mark.parametrize(
     "args,kwargs,strategy,expected_func_calls,expected_error",
     [
@@ -0,0 +1,101 @@
+import copy
+import pickle
+import weakref
+
+import pytest
+
+from moduvent import (
+    DataEvent,
+    Event,
+    EventManager,
+    Signal,
+    SlottedDataEvent,
+    SlottedSignal,
+)
+from moduvent.events import (
+    DataEventFactory,
+    EventFactory,
+    SignalFactory,
+    SlottedDataEventFactory,
+)
+
+
+class Custom(DataEvent): ...
+
+
+def test_builtin_events_keep_a_dict_and_weak_references():
+    for event in (Signal("s"), DataEvent(1, "s")):
+        event.extra = True
+        assert event.extra
+        assert weakref.ref(event)() is event
+    assert isinstance(DataEvent(1), Signal)
+
+
+def test_slotted_events_have_no_dict():
+    for event in (SlottedSignal("s"), SlottedDataEvent(1, "s")):
+        assert not hasattr(event, "__dict__")
+    with pytest.raises(AttributeError):
+        SlottedDataEvent(1).extra = True
+    assert str(SlottedDataEvent(1, "s")) == "Signal(SlottedDataEvent, sender=s)"
+
+
+def test_subclasses_without_slots_keep_a_dict():
+    event = Custom(1)
+    event.extra = True
+    assert event.extra
+
+
+def test_slotted_factory_classes():
+    Update = SlottedDataEventFactory.new("slotted-update")
+    Plain = SlottedDataEventFactory.new("plain-update", slotted=False)
+    assert not hasattr(Update(1), "__dict__")
+    assert hasattr(Plain(1), "__dict__")
+    Ping = EventFactory.create(SlottedSignal, slotted=True).new("slotted-ping")
+    assert not hasattr(Ping(), "__dict__")
+    # the classes generated from the builtin events keep their __dict__
+    assert hasattr(DataEventFactory.new("slotted-update", slotted=True)(1), "__dict__")
+
+
+def test_str_includes_slots():
+    class Point(Event):
+        __slots__ = ("x", "y")
+
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+    assert str(Point(1, 2)).endswith("Point(x=1, y=2)")
+    assert str(DataEvent(1, "s")) == "Signal(DataEvent, sender=s)"
+
+
+def test_muted_slotted_events():
+    Update = SlottedDataEventFactory.new("muted-update")
+    mgr = EventManager()
+
+    def handler(event):
+        return event.data
+
+    mgr.register(handler, Update)
+    with Update.muted():
+        assert mgr.emit(Update(1)) == []
+    assert mgr.emit(Update(2)) == [2]
+
+
+def test_slotted_events_pickle():
+    Update = SlottedDataEventFactory.new("pickled-update")
+    event = pickle.loads(pickle.dumps(Update(1, "s")))
+    assert type(event) is Update
+    assert (event.data, event.sender) == (1, "s")
+    event = pickle.loads(pickle.dumps(DataEvent(2)))
+    assert (event.data, event.sender) == (2, None)
+
+
+def test_copies_keep_the_class_of_the_factory():
+    Ready = SignalFactory.new("copied-ready")
+    OtherReady = EventFactory.create(Signal).new("copied-ready")
+    assert OtherReady is not Ready
+    for event_class in (Ready, OtherReady):
+        event = event_class("s")
+        for copied in (copy.copy(event), copy.deepcopy(event)):
+            assert type(copied) is event_class
+            assert copied.sender == "s"
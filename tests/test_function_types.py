@@ -0,0 +1,175 @@
+import functools
+import gc
+import weakref
+
+import pytest
+
+from moduvent import AsyncEventManager, Event, EventManager, subscribe_method
+from moduvent.utils import FunctionTypes, check_function_type, get_function_key
+
+
+class Job(Event):
+    def __init__(self, value=0):
+        self.value = value
+
+
+def double(event):
+    return event.value * 2
+
+
+def scale(factor, event):
+    return event.value * factor
+
+
+async def async_scale(factor, event):
+    return event.value * factor
+
+
+class Doubler:
+    def __call__(self, event):
+        return event.value * 2
+
+    def method(self, event):
+        return event.value
+
+
+class SlottedDoubler:
+    """A callable object that cannot be weakly referenced."""
+
+    __slots__ = ()
+
+    def __call__(self, event):
+        return event.value * 2
+
+
+class AsyncDoubler:
+    async def __call__(self, event):
+        return event.value * 2
+
+
+@pytest.mark.parametrize(
+    "func,expected",
+    [
+        (double, FunctionTypes.FUNCTION),
+        (Doubler().method, FunctionTypes.BOUND_METHOD),
+        (staticmethod(double), FunctionTypes.STATICMETHOD),
+        (len, FunctionTypes.BUILTIN),
+        ([].append, FunctionTypes.BUILTIN),
+        (str.upper, FunctionTypes.BUILTIN),
+        (functools.partial(scale, 3), FunctionTypes.PARTIAL),
+        (Doubler(), FunctionTypes.CALLABLE_OBJECT),
+        (Doubler, FunctionTypes.CALLABLE_OBJECT),
+        (None, FunctionTypes.UNKNOWN),
+        (42, FunctionTypes.UNKNOWN),
+    ],
+    ids=[
+        "function",
+        "bound_method",
+        "staticmethod",
+        "builtin_function",
+        "builtin_method",
+        "method_descriptor",
+        "partial",
+        "callable_object",
+        "class",
+        "none",
+        "not_callable",
+    ],
+)
+def test_check_function_type(func, expected):
+    assert check_function_type(func) == expected
+    # the second lookup is served from the cache of the type
+    assert check_function_type(func) == expected
+
+
+def test_bound_builtin_methods_share_a_key():
+    received = []
+    assert get_function_key(received.append) == get_function_key(received.append)
+    assert get_function_key(received.append) != get_function_key([].append)
+
+
+def test_partials_and_callable_objects_are_dispatched():
+    mgr = EventManager()
+    tripler = functools.partial(scale, 3)
+    doubler = Doubler()
+    mgr.register(tripler, Job)
+    mgr.register(doubler, Job)
+    assert mgr.emit(Job(2)) == [6, 4]
+    mgr.unsubscribe(tripler)
+    assert mgr.emit(Job(2)) == [4]
+
+
+def test_builtin_methods_are_held_strongly():
+    mgr = EventManager()
+    received = []
+    mgr.register(received.append, Job)
+    event = Job()
+    mgr.emit(event)
+    assert received == [event]
+    mgr.unsubscribe(received.append)
+    mgr.emit(Job())
+    assert received == [event]
+
+
+def test_callables_without_weak_references_are_held_strongly():
+    mgr = EventManager()
+    mgr.register(SlottedDoubler(), Job)
+    assert mgr.emit(Job(4)) == [8]
+    assert mgr.pruned_registrations == 0
+
+
+def test_partials_and_callable_objects_are_held_strongly():
+    mgr = EventManager()
+    mgr.register(functools.partial(scale, 3), Job)
+    mgr.register(Doubler(), Job)
+    gc.collect()
+    assert mgr.emit(Job(2)) == [6, 4]
+    assert mgr.pruned_registrations == 0
+
+
+def test_function_types_do_not_keep_classes_alive():
+    def make_callable():
+        class Temporary:
+            def __call__(self, event): ...
+
+        return Temporary
+
+    temporary = make_callable()
+    assert check_function_type(temporary()) == FunctionTypes.CALLABLE_OBJECT
+    reference = weakref.ref(temporary)
+    del temporary
+    gc.collect()
+    assert reference() is None
+
+
+def test_register_rejects_functions_that_cannot_be_called_with_an_event():
+    mgr = EventManager()
+
+    class Aware:
+        @subscribe_method(Job)
+        def on_job(self, event): ...
+
+    assert check_function_type(Aware.on_job) == FunctionTypes.UNBOUND_METHOD
+    with pytest.raises(TypeError):
+        mgr.register(Aware.on_job, Job)
+    with pytest.raises(TypeError):
+        mgr.register(42, Job)
+    assert mgr.emit(Job()) == []
+
+
+def test_registry_str_of_callables_without_qualname():
+    mgr = EventManager()
+    tripler = functools.partial(scale, 3)
+    registry = mgr.register(tripler, Job).registry
+    assert repr(tripler) in str(registry)
+
+
+@pytest.mark.asyncio
+async def test_async_partials_and_callable_objects():
+    mgr = AsyncEventManager()
+    tripler = functools.partial(async_scale, 3)
+    doubler = AsyncDoubler()
+    assert (await mgr.register(tripler, Job)).registry.coroutine
+    assert (await mgr.register(doubler, Job)).registry.coroutine
+    assert await mgr.emit(Job(2)) == [6, 4]
+    await mgr.stop()
@@ -0,0 +1,85 @@
+import asyncio
+import time
+
+import pytest
+
+from moduvent import AsyncEventManager, DataEvent, EventManager
+
+
+def export(event):
+    return event.data
+
+
+def test_token_bucket_allows_bursts_then_the_rate():
+    mgr = EventManager()
+    subscription = mgr.register(export, DataEvent, rate_limit=1000, burst=3)
+    results = [mgr.emit(DataEvent(value)) for value in range(10)]
+    assert results[:3] == [[0], [1], [2]]
+    assert sum(1 for result in results if result) < 10
+    limiter = subscription.registry.limiter
+    assert limiter.skipped == 10 - sum(1 for result in results if result)
+    time.sleep(0.01)
+    assert mgr.emit(DataEvent("refilled")) == ["refilled"]
+
+
+def test_leading_throttle_skips_the_rest_of_the_interval():
+    mgr = EventManager()
+    subscription = mgr.register(export, DataEvent, throttle=0.05)
+    assert mgr.emit(DataEvent(1)) == [1]
+    assert mgr.emit(DataEvent(2)) == []
+    assert mgr.emit(DataEvent(3)) == []
+    assert subscription.registry.limiter.skipped == 2
+    time.sleep(0.06)
+    assert mgr.emit(DataEvent(4)) == [4]
+    assert mgr.pump() == []
+
+
+def test_trailing_throttle_defers_the_last_event_until_pump():
+    mgr = EventManager()
+    subscription = mgr.register(export, DataEvent, throttle=0.03, trailing=True)
+    assert mgr.emit(DataEvent(1)) == [1]
+    assert mgr.emit(DataEvent(2)) == []
+    assert mgr.emit(DataEvent(3)) == []
+    assert mgr.pump() == []
+    time.sleep(0.04)
+    assert mgr.pump() == [[3]]
+    limiter = subscription.registry.limiter
+    assert (limiter.skipped, limiter.deferred) == (1, 1)
+    assert mgr.pump() == []
+
+
+def test_limits_do_not_apply_to_events_rejected_by_conditions():
+    mgr = EventManager()
+    subscription = mgr.register(
+        export, DataEvent, lambda event: event.data > 0, throttle=10
+    )
+    assert mgr.emit(DataEvent(0)) == []
+    assert mgr.emit(DataEvent(1)) == [1]
+    assert subscription.registry.limiter.skipped == 0
+
+
+def test_limit_validation():
+    mgr = EventManager()
+    with pytest.raises(ValueError):
+        mgr.register(export, DataEvent, rate_limit=1, throttle=1)
+    with pytest.raises(ValueError):
+        mgr.register(export, DataEvent, rate_limit=0)
+    with pytest.raises(ValueError):
+        mgr.register(export, DataEvent, throttle=-1)
+
+
+@pytest.mark.asyncio
+async def test_async_trailing_throttle_releases_on_a_timer():
+    mgr = AsyncEventManager()
+    seen = []
+
+    async def record(event):
+        seen.append(event.data)
+
+    await mgr.register(record, DataEvent, throttle=0.02, trailing=True)
+    for value in range(5):
+        await mgr.emit(DataEvent(value))
+    assert seen == [0]
+    await asyncio.sleep(0.05)
+    assert seen == [0, 4]
+    await mgr.stop()
@@ -0,0 +1,110 @@
+import pytest
+
+from moduvent import AsyncEventManager, Event, EventManager
+from moduvent.events import DataEventFactory, SignalFactory
+
+
+class Job(Event):
+    def __init__(self, value=0):
+        self.value = value
+
+
+class Other(Event): ...
+
+
+def double(event):
+    return event.value * 2
+
+
+def fail(event):
+    raise RuntimeError("boom")
+
+
+async def triple(event):
+    return event.value * 3
+
+
+def test_metrics_are_off_by_default():
+    mgr = EventManager()
+    subscription = mgr.register(double, Job)
+    mgr.emit(Job(1))
+    assert mgr.metrics is None
+    assert subscription.registry.metrics is None
+    assert "emits" not in mgr.stats()
+    assert mgr.stats()["dropped_events"] == 0
+
+
+def test_metrics_count_emits_calls_errors_and_rejections():
+    mgr = EventManager(metrics=True)
+    mgr.register(double, Job, lambda event: event.value > 0)
+    mgr.register(fail, Job)
+    mgr.emit(Job(1))
+    mgr.emit(Job(0))
+    mgr.emit(Other())
+    mgr.emit_many([Job(2), Other()])
+
+    stats = mgr.stats()
+
+    assert stats["emits"] == {Job: 3, Other: 2}
+    assert stats["queue_high_water"] == 2
+    doubled, failed = stats["handlers"]
+    assert doubled["handler"] == "double" and doubled["event_type"] == Job
+    assert (doubled["calls"], doubled["errors"], doubled["rejections"]) == (2, 0, 1)
+    assert (failed["calls"], failed["errors"], failed["rejections"]) == (3, 3, 0)
+    assert sum(doubled["latency"].values()) == 2
+    assert doubled["mean_time"] > 0
+
+
+def test_enabling_metrics_covers_existing_registrations_and_restarts():
+    mgr = EventManager()
+    subscription = mgr.register(double, Job)
+    mgr.emit(Job(1))
+    mgr.enable_metrics()
+    mgr.emit(Job(1))
+    assert subscription.registry.metrics.calls == 1
+    mgr.enable_metrics()
+    assert subscription.registry.metrics.calls == 0
+    mgr.disable_metrics()
+    assert subscription.registry.metrics is None
+    assert "handlers" not in mgr.stats()
+
+
+def test_types_of_the_same_name_are_counted_apart():
+    def make_update():
+        class Update(Event): ...
+
+        return Update
+
+    First, Second = make_update(), make_update()
+    mgr = EventManager(metrics=True)
+    mgr.emit(First())
+    mgr.emit(Second())
+    mgr.emit(Second())
+    assert mgr.stats()["emits"] == {First: 1, Second: 2}
+    # the factories of two base classes generate classes of the same module and name
+    SignalReady = SignalFactory.new("same-name")
+    DataReady = DataEventFactory.new("same-name")
+    mgr.register(fail, SignalReady)
+    mgr.register(fail, DataReady)
+    mgr.emit(SignalReady())
+    mgr.emit(DataReady(None))
+    stats = mgr.stats()
+    assert stats["emits"][SignalReady] == stats["emits"][DataReady] == 1
+    assert {handler["event_type"] for handler in stats["handlers"]} == {
+        SignalReady,
+        DataReady,
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_metrics():
+    mgr = AsyncEventManager(metrics=True)
+    await mgr.register(triple, Job)
+    await mgr.register(double, Job)
+    assert await mgr.emit(Job(1)) == [3, 2]
+    await mgr.emit_many([Job(2), Job(3)])
+    stats = mgr.stats()
+    assert stats["emits"] == {Job: 3}
+    assert stats["queue_high_water"] >= 1
+    assert [handler["calls"] for handler in stats["handlers"]] == [3, 3]
+    await mgr.stop()
@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+
+from moduvent import (
+    AsyncEventManager,
+    Event,
+    EventAwareBase,
+    EventManager,
+    subscribe_method,
+)
+
+
+class Update(Event): ...
+
+
+class SubUpdate(Update): ...
+
+
+def analytics(event):
+    return "analytics"
+
+
+def audit(event):
+    return "audit"
+
+
+def invalidate_cache(event):
+    return "invalidate_cache"
+
+
+def test_higher_priority_runs_first_and_ties_keep_registration_order():
+    mgr = EventManager()
+    mgr.register(analytics, Update, priority=-1)
+    mgr.register(audit, Update)
+    mgr.register(invalidate_cache, Update, priority=10)
+    assert mgr.emit(Update()) == ["invalidate_cache", "audit", "analytics"]
+    plan = mgr._dispatch_plans[Update]
+    assert [entry[3].priority for entry in plan] == [10, 0, -1]
+
+
+def test_unsubscribing_keeps_the_dispatch_order():
+    mgr = EventManager()
+    mgr.register(analytics, Update, priority=-1)
+    subscription = mgr.register(audit, Update)
+    mgr.register(invalidate_cache, Update, priority=10)
+    mgr.register(audit, Update, priority=-1)
+    subscription.cancel()
+    assert mgr.emit(Update()) == ["invalidate_cache", "analytics", "audit"]
+
+
+def test_hierarchical_plans_merge_by_priority():
+    mgr = EventManager(hierarchical=True)
+    mgr.register(analytics, Update)
+    mgr.register(audit, SubUpdate)
+    mgr.register(invalidate_cache, Update, priority=1)
+    assert mgr.emit(SubUpdate()) == ["invalidate_cache", "analytics", "audit"]
+
+
+def test_subscribe_and_subscribe_method_accept_priority():
+    mgr = EventManager()
+
+    @mgr.subscribe(Update)
+    def first(event):
+        return "first"
+
+    class Aware(EventAwareBase):
+        @subscribe_method(Update, priority=5)
+        def urgent(self, event):
+            return "urgent"
+
+    aware = Aware(mgr)
+    assert mgr.emit(Update()) == ["urgent", "first"]
+    del aware
+
+
+@pytest.mark.asyncio
+async def test_async_callqueue_runs_higher_priority_first():
+    mgr = AsyncEventManager(worker_count=1)
+    release = asyncio.Event()
+    order = []
+
+    async def gate(event):
+        await release.wait()
+
+    async def slow(event):
+        order.append("slow")
+
+    async def urgent(event):
+        order.append("urgent")
+
+    class Gate(Event): ...
+
+    await mgr.register(gate, Gate)
+    await mgr.register(slow, Update)
+    await mgr.register(urgent, SubUpdate, priority=10)
+    await mgr.emit(Gate(), wait=False)
+    await asyncio.sleep(0)
+    await mgr.emit(Update(), wait=False)
+    await mgr.emit(SubUpdate(), wait=False)
+    release.set()
+    await mgr.stop()
+    assert order == ["urgent", "slow"]
+
+
+@pytest.mark.asyncio
+async def test_async_drop_oldest_drops_the_lowest_priority():
+    mgr = AsyncEventManager(worker_count=1, maxsize=2, overflow="drop_oldest")
+    release = asyncio.Event()
+    order = []
+
+    async def gate(event):
+        await release.wait()
+
+    async def slow(event):
+        order.append("slow")
+
+    async def urgent(event):
+        order.append("urgent")
+
+    class Gate(Event): ...
+
+    await mgr.register(gate, Gate)
+    await mgr.register(slow, Update)
+    await mgr.register(urgent, SubUpdate, priority=10)
+    await mgr.emit(Gate(), wait=False)
+    await asyncio.sleep(0)
+    await mgr.emit(SubUpdate(), wait=False)
+    await mgr.emit(Update(), wait=False)
+    await mgr.emit(SubUpdate(), wait=False)
+    release.set()
+    await mgr.stop()
+    assert order == ["urgent", "urgent"]
+    assert mgr.dropped_events == 1
@@ -0,0 +1,69 @@
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from moduvent import DataEvent, EventManager, data_event, signal
+
+Square = data_event("Square")
+Ping = signal("Ping")
+
+
+def square(event):
+    return event.data * event.data
+
+
+def worker_pid(event):
+    return os.getpid()
+
+
+def fail(event):
+    raise ValueError(event.data)
+
+
+@pytest.fixture
+def mgr():
+    executor = ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    )
+    mgr = EventManager(process_executor=executor, process_batch_size=4)
+    yield mgr
+    executor.shutdown()
+
+
+def test_factory_events_pickle_by_reference():
+    event = pickle.loads(pickle.dumps(Square(3)))
+    assert type(event) is Square
+    assert event.data == 3
+    assert type(pickle.loads(pickle.dumps(Ping()))) is Ping
+
+
+def test_process_callback_results_are_returned_by_emit(mgr):
+    mgr.register(square, Square, process=True)
+    mgr.register(worker_pid, Square)
+    assert mgr.emit(Square(7)) == [49, os.getpid()]
+
+
+def test_process_callback_runs_in_another_process(mgr):
+    mgr.register(worker_pid, DataEvent, process=True)
+    assert mgr.emit(DataEvent(None)) != [os.getpid()]
+
+
+def test_emit_many_batches_process_callbacks(mgr):
+    mgr.register(square, Square, process=True)
+    assert mgr.emit_many([Square(i) for i in range(10)]) == [[i * i] for i in range(10)]
+
+
+def test_emit_many_keeps_process_results_in_place(mgr):
+    mgr.register(fail, Square, process=True)
+    mgr.register(square, Square)
+    mgr.register(square, Square, process=True)
+    assert mgr.emit_many([Square(2), Square(3)]) == [[None, 4, 4], [None, 9, 9]]
+
+
+def test_process_callback_errors_yield_none(mgr):
+    mgr.register(fail, Square, process=True)
+    mgr.register(square, Square)
+    assert mgr.emit(Square(2)) == [None, 4]
@@ -0,0 +1,145 @@
+import gc
+
+import pytest
+
+from moduvent import (
+    AsyncEventManager,
+    Event,
+    EventAwareBase,
+    EventManager,
+    Subscription,
+    subscribe_method,
+)
+
+
+class Ping(Event): ...
+
+
+class Pong(Event): ...
+
+
+def on_ping(event):
+    return "on_ping"
+
+
+def on_pong(event):
+    return "on_pong"
+
+
+class Listener:
+    def on_event(self, event):
+        return "listener"
+
+
+def test_register_returns_cancellable_handle():
+    mgr = EventManager()
+    subscription = mgr.register(on_ping, Ping)
+    mgr.register(on_pong, Ping)
+
+    assert isinstance(subscription, Subscription)
+    assert subscription.active
+    assert mgr.emit(Ping()) == ["on_ping", "on_pong"]
+
+    assert subscription.cancel()
+    assert not subscription.active
+    assert not subscription.cancel()
+    assert mgr.emit(Ping()) == ["on_pong"]
+
+
+def test_cancel_drops_empty_event_types_and_index_entries():
+    mgr = EventManager()
+    subscription = mgr.register(on_ping, Ping)
+
+    subscription.cancel()
+
+    assert mgr._subscriptions == {}
+    assert mgr._registrations == {}
+
+
+def test_unsubscribe_by_function_does_not_rebuild_subscriptions(monkeypatch):
+    mgr = EventManager()
+    mgr.register(on_ping, Ping)
+    mgr.register(on_ping, Pong)
+    mgr.register(on_pong, Pong)
+
+    def fail(*args):
+        raise AssertionError("unsubscribe walked every registration")
+
+    monkeypatch.setattr(mgr, "_remove_subscriptions", fail)
+    mgr.unsubscribe(on_ping)
+
+    assert mgr._subscriptions == {Pong: [on_pong]}
+    assert mgr.emit(Ping()) == []
+    assert mgr.emit(Pong()) == ["on_pong"]
+
+
+def test_unsubscribe_bound_method_only_affects_its_instance():
+    mgr = EventManager()
+    first, second = Listener(), Listener()
+    mgr.register(first.on_event, Ping)
+    mgr.register(second.on_event, Ping)
+
+    mgr.unsubscribe(first.on_event, Ping)
+
+    assert mgr._subscriptions == {Ping: [second.on_event]}
+
+
+def test_reset_deactivates_handles():
+    mgr = EventManager()
+    subscription = mgr.register(on_ping, Ping)
+
+    mgr.reset()
+
+    assert not subscription.active
+    assert not subscription.cancel()
+
+
+@pytest.mark.asyncio
+async def test_async_handle_and_unsubscribe():
+    async def on_async_ping(event):
+        return "async"
+
+    mgr = AsyncEventManager()
+    subscription = await mgr.register(on_async_ping, Ping)
+    await mgr.register(on_async_ping, Pong)
+
+    assert await mgr.emit(Ping()) == ["async"]
+    subscription.cancel()
+    assert await mgr.emit(Ping()) == []
+    mgr.unsubscribe(on_async_ping)
+    assert await mgr.emit(Pong()) == []
+
+
+def test_dead_bound_method_registrations_are_pruned():
+    mgr = EventManager()
+    listener = Listener()
+    subscription = mgr.register(listener.on_event, Ping)
+    mgr.register(on_ping, Ping)
+
+    del listener
+    gc.collect()
+
+    assert mgr.emit(Ping()) == ["on_ping"]
+    assert not subscription.active
+    assert mgr.pruned_registrations == 1
+    assert mgr._subscriptions == {Ping: [on_ping]}
+    assert len(mgr._registrations) == 1
+
+
+def test_event_aware_instances_do_not_leak_registrations():
+    mgr = EventManager()
+
+    class Aware(EventAwareBase):
+        @subscribe_method(Ping)
+        def on_ping(self, event):
+            return "aware"
+
+    aware = Aware(mgr)
+    assert mgr.emit(Ping()) == ["aware"]
+
+    del aware
+    gc.collect()
+
+    assert mgr.emit(Ping()) == []
+    assert mgr.pruned_registrations == 1
+    assert mgr._subscriptions == {}
@@ -0,0 +1,108 @@
+import pytest
+
+from moduvent import AsyncEventManager, DataEvent, Event, EventManager, Signal
+
+
+class Ready(Signal): ...
+
+
+class Sender:
+    def __init__(self, name):
+        self.name = name
+
+
+def from_any(signal):
+    return "any"
+
+
+def from_a(signal):
+    return "a"
+
+
+def from_b(signal):
+    return "b"
+
+
+def test_where_routes_by_sender():
+    mgr = EventManager()
+    a, b = Sender("a"), Sender("b")
+    mgr.register(from_a, Ready, where={"sender": a})
+    mgr.register(from_any, Ready)
+    mgr.register(from_b, Ready, where={"sender": b})
+    assert mgr.emit(Ready(a)) == ["a", "any"]
+    assert mgr.emit(Ready(b)) == ["any", "b"]
+    assert mgr.emit(Ready(Sender("c"))) == ["any"]
+
+
+def test_where_entries_are_indexed_out_of_the_linear_plan():
+    mgr = EventManager()
+    senders = [Sender(str(index)) for index in range(1000)]
+    handlers = []
+    for sender in senders:
+
+        def handler(signal, name=sender.name):
+            return name
+
+        handlers.append(handler)
+        mgr.register(handler, Ready, where={"sender": sender})
+    assert mgr.emit(Ready(senders[42])) == ["42"]
+    plan = mgr._dispatch_plans[Ready]
+    assert len(plan) == 0
+    assert len(plan.where[("sender",)][1]) == 1000
+
+
+def test_where_respects_priority_and_conditions():
+    mgr = EventManager()
+    mgr.register(from_any, DataEvent)
+    mgr.register(from_a, DataEvent, where={"data": 1}, priority=1)
+    mgr.register(
+        from_b, DataEvent, lambda event: event.sender == "x", where={"data": 1}
+    )
+    assert mgr.emit(DataEvent(1)) == ["a", "any"]
+    assert mgr.emit(DataEvent(1, "x")) == ["a", "any", "b"]
+
+
+def test_where_on_several_attributes():
+    mgr = EventManager()
+    mgr.register(from_a, DataEvent, where={"sender": "s", "data": 1})
+    assert mgr.emit(DataEvent(1)) == []
+    assert mgr.emit(DataEvent(1, "s")) == ["a"]
+
+
+def test_where_skips_missing_and_unhashable_attributes():
+    mgr = EventManager()
+
+    class Plain(Event): ...
+
+    mgr.register(from_a, Plain, where={"sender": None})
+    assert mgr.emit(Plain()) == []
+    mgr.register(from_b, DataEvent, where={"data": 1})
+    assert mgr.emit(DataEvent([1])) == []
+
+
+def test_where_validation():
+    mgr = EventManager()
+    with pytest.raises(ValueError):
+        mgr.register(from_a, DataEvent, where={"data": [1]})
+    with pytest.raises(ValueError):
+        mgr.register(from_a, DataEvent, where={})
+
+
+def test_subscribe_with_where_and_cancel():
+    mgr = EventManager()
+
+    @mgr.subscribe(DataEvent, where={"data": "on"})
+    def switched_on(event):
+        return "on"
+
+    assert mgr.emit(DataEvent("on")) == ["on"]
+    mgr.unsubscribe(switched_on)
+    assert mgr.emit(DataEvent("on")) == []
+
+
+@pytest.mark.asyncio
+async def test_async_where():
+    mgr = AsyncEventManager()
+    await mgr.register(from_a, DataEvent, where={"data": 1})
+    assert await mgr.emit(DataEvent(1)) == ["a"]
+    assert await mgr.emit(DataEvent(2)) == []